@@ -1,6 +1,11 @@
 """Kumbuka CLI entry point."""
 
-from typing import Optional
+from typing import Optional, cast
+import argparse
+import functools
+import os
+import re
+import shlex
 import sys
 import subprocess
 import time
@@ -8,18 +13,15 @@ from datetime import datetime
 from pathlib import Path
 
 from .config import (
-    SAMPLE_RATE, CHANNELS, PACKAGE_DIR, PROMPT_MINUTES, OUTPUT_DIR, LOG_DIR, ENV_FILE, CONFIG_DIR,
+    SAMPLE_RATE, PACKAGE_DIR, PROMPT_MINUTES, OUTPUT_DIR, LOG_DIR, ENV_FILE, CONFIG_DIR,
     NOTES_DESTINATION, NOTION_URL, NOTION_MODE, OBSIDIAN_VAULT, OBSIDIAN_FOLDER, AUTO_RECORD, BUFFER_MINUTES,
-    AUDIO_DEVICE,
+    AUDIO_DEVICE, MONITOR_PROCESS_TYPE,
 )
-from .audio_devices import resolve_recording_config, find_blackhole, query_input_devices
 from .filenames import sanitize_filename
-from .recorder import record, recover_partial
-from .transcriber import transcribe, check_fluidaudio
-from .processor import process_with_claude, find_claude
-from .notes import save_meeting_notes
+from .notes import save_meeting_notes, preload_backend
 from . import recording_lock
-
+# Audio, transcription and Claude modules are imported inside the commands
+# that use them so `help`, `config` and `monitor` start quickly.
 
 # Valid config keys and their env var names
 CONFIG_KEYS = {
@@ -38,16 +40,23 @@ CONFIG_KEYS = {
     "buffer_minutes": "KUMBUKA_BUFFER_MINUTES",
     "log_dir": "KUMBUKA_LOG_DIR",
     "audio_device": "KUMBUKA_AUDIO_DEVICE",
+    "monitor_process_type": "KUMBUKA_MONITOR_PROCESS_TYPE",
 }
 
 
-PLIST_NAME = "com.kumbuka.monitor.plist"
+MONITOR_LABEL = "com.kumbuka.monitor"
+PLIST_NAME = f"{MONITOR_LABEL}.plist"
 PLIST_SRC = PACKAGE_DIR / "daemon" / PLIST_NAME
 PLIST_DST = Path.home() / "Library/LaunchAgents" / PLIST_NAME
+_PLIST_PLACEHOLDER_RE = re.compile(r"__([A-Z_]+)__")
 
 
+@functools.lru_cache(maxsize=1)
 def check_requirements() -> bool:
-    """Verify all requirements are met."""
+    """Verify all requirements are met (checked once per process)."""
+    from .transcriber import check_fluidaudio
+    from .runtime import find_claude
+
     errors = []
 
     if not check_fluidaudio():
@@ -103,12 +112,41 @@ def _rename_session_files(session: str, filename: str | None):
     for ext in (".wav", ".txt"):
         old = OUTPUT_DIR / f"{session}{ext}"
         new = OUTPUT_DIR / f"{filename}{ext}"
-        if old.exists():
-            # Avoid overwriting existing files by appending the date
-            if new.exists():
-                new = OUTPUT_DIR / f"{filename}_{session}{ext}"
+        # Avoid overwriting existing files by appending the date
+        if new.exists():
+            new = OUTPUT_DIR / f"{filename}_{session}{ext}"
+        try:
             old.rename(new)
-            print(f"📁 Renamed: {old.name} → {new.name}")
+        except FileNotFoundError:
+            continue
+        print(f"📁 Renamed: {old.name} → {new.name}")
+
+
+def _prepare_post_processing() -> str:
+    """Load the prompt template and notes backend ahead of Claude processing."""
+    from .processor import load_prompt
+
+    preload_backend(NOTES_DESTINATION, notion_mode=NOTION_MODE)
+    return load_prompt()
+
+
+def _transcribe_with_prefetch(wav_path: Path) -> tuple[str | None, str | None]:
+    """Transcribe while the Claude/notes stages are prepared in the background.
+
+    Returns (transcript, prompt_template). The template is None if it could
+    not be prepared; process_with_claude then loads it and reports the error.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from .transcriber import transcribe
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        prepared = pool.submit(_prepare_post_processing)
+        transcript = transcribe(wav_path)
+        try:
+            template = prepared.result()
+        except Exception:  # pylint: disable=broad-exception-caught
+            template = None
+    return transcript, template
 
 
 def _save_notes(result: dict) -> tuple[str, str] | None:
@@ -134,8 +172,45 @@ def _save_notes(result: dict) -> tuple[str, str] | None:
     return saved
 
 
+def _note_timestamp() -> str:
+    """Current local time as YYYY-MM-DD HH:MM, without going through strftime."""
+    now = datetime.now()
+    return f"{now.year:04d}-{now.month:02d}-{now.day:02d} {now.hour:02d}:{now.minute:02d}"
+
+
+def _finalize(wav_path: Path, duration_secs: float) -> None:
+    """Transcribe a recorded session, process it with Claude and save notes."""
+    from .processor import process_with_claude
+
+    # Transcribe
+    transcript, template = _transcribe_with_prefetch(wav_path)
+    if not transcript:
+        print("❌ Transcription failed")
+        sys.exit(1)
+
+    # Process with Claude
+    m, s = divmod(int(duration_secs), 60)
+
+    result = _run_with_retry(
+        "Claude processing",
+        process_with_claude,
+        transcript=transcript,
+        duration=f"{m}m {s}s",
+        timestamp=_note_timestamp(),
+        template=template,
+    )
+
+    if result:
+        filename = sanitize_filename(result.get("filename", ""))
+        _rename_session_files(wav_path.stem, filename)
+        _run_with_retry("notes export", _save_notes, result)
+
+
 def do_record():
     """Main recording flow."""
+    from .recorder import record
+    from .transcriber import build_in_background
+
     if not check_requirements():
         sys.exit(1)
 
@@ -153,81 +228,37 @@ def do_record():
         sys.exit(0)
 
     try:
+        # Build FluidAudio (first run only) while the meeting is recorded
+        build_in_background()
+
         # Record
-        wav, session = record()
-        if not wav or not session:
+        wav_path, duration_secs = record()
+        if not wav_path:
             sys.exit(1)
-        assert session is not None  # narrowing for type checker
+        wav_path = cast(Path, wav_path)  # narrowing for type checker
     finally:
         recording_lock.release()
 
     # Post-processing runs without the lock so back-to-back meetings
     # can start recording while we transcribe/process.
-
-    # Transcribe
-    wav_path = OUTPUT_DIR / f"{session}.wav"
-    transcript = transcribe(wav_path)
-    if not transcript:
-        print("❌ Transcription failed")
-        sys.exit(1)
-
-    # Process with Claude
-    # Duration: bytes / (sample_rate * bytes_per_sample * channels)
-    duration_secs = len(wav) / (SAMPLE_RATE * 2 * CHANNELS)
-    m, s = divmod(int(duration_secs), 60)
-
-    result = _run_with_retry(
-        "Claude processing",
-        process_with_claude,
-        transcript=transcript,
-        duration=f"{m}m {s}s",
-        timestamp=datetime.now().strftime("%Y-%m-%d %H:%M")
-    )
-
-    if result:
-        filename = sanitize_filename(result.get("filename", ""))
-        _rename_session_files(session, filename)
-        _run_with_retry("notes export", _save_notes, result)
-
+    _finalize(wav_path, duration_secs)
     print("\n✅ Done!")
 
 
 def do_recover(session: Optional[str] = None):
     """Recover a partial recording that was interrupted."""
+    from .recorder import recover_partial
+
     if not check_requirements():
         sys.exit(1)
 
-    wav, recovered_session = recover_partial(session)
-    if not wav or not recovered_session:
+    wav_path, duration_secs = recover_partial(session)
+    if not wav_path:
         print("❌ No partial recording to recover")
         sys.exit(1)
-    assert recovered_session is not None  # narrowing for type checker
-
-    # Transcribe
-    wav_path = OUTPUT_DIR / f"{recovered_session}.wav"
-    transcript = transcribe(wav_path)
-    if not transcript:
-        print("❌ Transcription failed")
-        sys.exit(1)
-
-    # Process with Claude
-    # Duration: bytes / (sample_rate * bytes_per_sample * channels)
-    duration_secs = len(wav) / (SAMPLE_RATE * 2 * CHANNELS)
-    m, s = divmod(int(duration_secs), 60)
-
-    result = _run_with_retry(
-        "Claude processing",
-        process_with_claude,
-        transcript=transcript,
-        duration=f"{m}m {s}s",
-        timestamp=datetime.now().strftime("%Y-%m-%d %H:%M")
-    )
-
-    if result:
-        filename = sanitize_filename(result.get("filename", ""))
-        _rename_session_files(recovered_session, filename)
-        _run_with_retry("notes export", _save_notes, result)
+    wav_path = cast(Path, wav_path)  # narrowing for type checker
 
+    _finalize(wav_path, duration_secs)
     print("\n✅ Recovery complete!")
 
 
@@ -240,21 +271,48 @@ def monitor_enable():
     auto_record = "true" if AUTO_RECORD else "false"
     buffer_minutes = str(BUFFER_MINUTES)
 
-    plist_content = PLIST_SRC.read_text()
-    plist_content = plist_content.replace("__PYTHON_PATH__", python_path)
-    plist_content = plist_content.replace("__PROMPT_MINUTES__", prompt_minutes)
-    plist_content = plist_content.replace("__OUTPUT_DIR__", str(OUTPUT_DIR))
-    plist_content = plist_content.replace("__LOG_DIR__", str(LOG_DIR))
-    plist_content = plist_content.replace("__AUTO_RECORD__", auto_record)
-    plist_content = plist_content.replace("__BUFFER_MINUTES__", buffer_minutes)
+    placeholders = {
+        "PYTHON_PATH": python_path,
+        "PROMPT_MINUTES": prompt_minutes,
+        "OUTPUT_DIR": str(OUTPUT_DIR),
+        "LOG_DIR": str(LOG_DIR),
+        "AUTO_RECORD": auto_record,
+        "BUFFER_MINUTES": buffer_minutes,
+        "PROCESS_TYPE": MONITOR_PROCESS_TYPE,
+    }
+    # Single pass over the template; substituted values are never rescanned
+    plist_content = _PLIST_PLACEHOLDER_RE.sub(
+        lambda m: placeholders.get(m.group(1), m.group(0)),
+        PLIST_SRC.read_text(),
+    )
 
-    PLIST_DST.parent.mkdir(parents=True, exist_ok=True)
-    PLIST_DST.write_text(plist_content)
+    try:
+        unchanged = PLIST_DST.read_text() == plist_content
+    except FileNotFoundError:
+        unchanged = False
+
+    loaded = _monitor_loaded()
+    if unchanged and loaded:
+        # Same plist, but the resident monitor only reads the package and
+        # env file at startup; restart it so upgrades and settings apply
+        cmd = ["launchctl", "kickstart", "-k", f"gui/{os.getuid()}/{MONITOR_LABEL}"]
+    else:
+        PLIST_DST.parent.mkdir(parents=True, exist_ok=True)
+        PLIST_DST.write_text(plist_content)
 
-    subprocess.run(["launchctl", "unload", str(PLIST_DST)],
-                   capture_output=True, check=False)
-    result = subprocess.run(["launchctl", "load", str(
-        PLIST_DST)], capture_output=True, check=False)
+        if loaded:
+            # Reload in a single spawn; the exit status is that of `launchctl load`
+            plist = shlex.quote(str(PLIST_DST))
+            cmd = ["/bin/sh", "-c", f"launchctl unload {plist} >/dev/null 2>&1; launchctl load {plist}"]
+        else:
+            # Nothing to unload (e.g. first enable)
+            cmd = ["launchctl", "load", str(PLIST_DST)]
+    result = subprocess.run(
+        cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        check=False,
+    )
 
     if result.returncode == 0:
         mode = "auto-record" if AUTO_RECORD else "prompt"
@@ -264,7 +322,8 @@ def monitor_enable():
             print(f"   Buffer: {buffer_minutes} min after meeting end")
         print(f"   Logs: {LOG_DIR}")
     else:
-        print(f"❌ Failed to enable monitor: {result.stderr.decode()}")
+        error = result.stderr.decode(errors="replace").strip()
+        print(f"❌ Failed to enable monitor: {error}")
         sys.exit(1)
 
 
@@ -272,23 +331,28 @@ def monitor_disable():
     """Disable meeting monitor daemon."""
     if PLIST_DST.exists():
         subprocess.run(["launchctl", "unload", str(PLIST_DST)],
-                       capture_output=True, check=False)
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                       check=False)
         PLIST_DST.unlink()
         print("✅ Meeting monitor disabled")
     else:
         print("ℹ️  Monitor was not enabled")
 
 
-def monitor_status():
-    """Check if monitor is running."""
+def _monitor_loaded() -> bool:
+    """Return True if the monitor job is loaded in the user's launchd domain."""
     result = subprocess.run(
-        ["launchctl", "list"],
-        capture_output=True,
-        text=True,
-        check=False
+        ["launchctl", "print", f"gui/{os.getuid()}/{MONITOR_LABEL}"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=False,
     )
+    return result.returncode == 0
+
 
-    if "com.kumbuka.monitor" in result.stdout:
+def monitor_status():
+    """Check if monitor is running."""
+    if _monitor_loaded():
         print("✅ Meeting monitor is running")
         log = LOG_DIR / "monitor.log"
         if log.exists():
@@ -334,14 +398,15 @@ def calendar_setup():
 
 def calendar_test():
     """Test calendar by showing upcoming events from Chrome."""
-    from .calendar_scraper import get_upcoming_events, get_current_meetings, is_authenticated
+    from .calendar_scraper import get_meetings, is_authenticated
 
     if not is_authenticated():
         print("❌ Not authenticated. Run: kumbuka calendar setup")
         sys.exit(1)
 
+    upcoming, current = get_meetings(300)
+
     print("Current meetings:")
-    current = get_current_meetings()
     if current:
         for event in current:
             parts = f" ({', '.join(event.participants)})" if event.participants else ""
@@ -350,7 +415,6 @@ def calendar_test():
         print("  (none)")
 
     print("\nUpcoming meetings (next 5 hrs):")
-    upcoming = get_upcoming_events(300)
     if upcoming:
         for event in upcoming:
             parts = f" ({', '.join(event.participants)})" if event.participants else ""
@@ -359,11 +423,12 @@ def calendar_test():
         print("  (none)")
 
 
-def _read_env_file() -> dict[str, str]:
-    """Read key=value pairs from the env file."""
+@functools.lru_cache(maxsize=1)
+def _parse_env_file(_mtime_ns: int) -> dict[str, str]:
+    """Parse the env file; cached per modification time."""
     values = {}
-    if ENV_FILE.exists():
-        for line in ENV_FILE.read_text(encoding="utf-8").splitlines():
+    with open(ENV_FILE, encoding="utf-8") as f:
+        for line in f:
             stripped = line.strip()
             if not stripped or stripped.startswith("#"):
                 continue
@@ -373,27 +438,61 @@ def _read_env_file() -> dict[str, str]:
     return values
 
 
+def _read_env_file() -> dict[str, str]:
+    """Read key=value pairs from the env file."""
+    try:
+        mtime_ns = ENV_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    return dict(_parse_env_file(mtime_ns))
+
+
 def _write_env_value(env_var: str, value: str):
     """Set a value in the env file, preserving comments and other keys."""
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
     lines = []
     found = False
-    if ENV_FILE.exists():
-        for line in ENV_FILE.read_text(encoding="utf-8").splitlines():
-            stripped = line.strip()
-            if stripped and not stripped.startswith("#") and "=" in stripped:
-                key = stripped.partition("=")[0].strip()
-                if key == env_var:
-                    lines.append(f'{env_var}="{value}"')
-                    found = True
-                    continue
-            lines.append(line)
+    try:
+        with open(ENV_FILE, encoding="utf-8") as f:
+            for line in f:
+                line = line.rstrip("\r\n")
+                stripped = line.strip()
+                # Cheap prefix test first; only candidate lines get partitioned
+                if stripped.startswith(env_var) and "=" in stripped:
+                    key = stripped.partition("=")[0].strip()
+                    if key == env_var:
+                        lines.append(f'{env_var}="{value}"')
+                        found = True
+                        continue
+                lines.append(line)
+    except FileNotFoundError:
+        pass
 
     if not found:
         lines.append(f'{env_var}="{value}"')
 
-    ENV_FILE.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    # Write a sibling temp file and swap it in so an interrupted write
+    # can't leave a truncated config behind
+    # The file may hold NOTION_TOKEN: the temp file gets the original's
+    # permissions (private for a new file) before any content is written
+    try:
+        mode = ENV_FILE.stat().st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o600
+    tmp = ENV_FILE.with_name(ENV_FILE.name + ".tmp")
+    try:
+        tmp.unlink(missing_ok=True)
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            os.fchmod(fd, mode)  # exact mode, regardless of umask
+            f.write("\n".join(lines) + "\n")
+        os.replace(tmp, ENV_FILE)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    # mtime may not change within the filesystem's timestamp granularity
+    _parse_env_file.cache_clear()
 
 
 def config_set(key: str, value: str):
@@ -461,6 +560,10 @@ def do_record_only(duration: int, meeting: str = ""):
     the pipeline continues best-effort.  Designed to run headless from the
     monitor daemon.
     """
+    from .recorder import record
+    from .transcriber import build_in_background
+    from .processor import process_with_claude
+
     # Check for an active recording session
     holder = recording_lock.acquire("auto", meeting=meeting)
     if holder is not None:
@@ -472,12 +575,14 @@ def do_record_only(duration: int, meeting: str = ""):
 
     try:
         _auto_log(f"Recording started (duration={duration}s)")
+        build_in_background()
 
-        wav, session = record(duration_secs=duration)
-        if not wav or not session:
+        wav_path, recorded_secs = record(duration_secs=duration)
+        if not wav_path:
             _auto_log("Recording failed — no audio captured")
             return
-        assert session is not None
+        wav_path = cast(Path, wav_path)
+        session = wav_path.stem
         _auto_log(f"Recording saved: {session}")
     finally:
         recording_lock.release()
@@ -485,10 +590,9 @@ def do_record_only(duration: int, meeting: str = ""):
     # Post-processing runs without the lock so back-to-back meetings
     # can start recording while we transcribe/process.
 
-    # Transcribe
-    wav_path = OUTPUT_DIR / f"{session}.wav"
+    # Transcribe (prompt and notes backend load alongside)
     try:
-        transcript = transcribe(wav_path)
+        transcript, template = _transcribe_with_prefetch(wav_path)
     except Exception as e:
         _auto_log(f"Transcription failed: {e}")
         return
@@ -498,13 +602,13 @@ def do_record_only(duration: int, meeting: str = ""):
     _auto_log(f"Transcription complete ({len(transcript)} chars)")
 
     # Process with Claude
-    duration_secs = len(wav) / (SAMPLE_RATE * 2 * CHANNELS)
-    m, s = divmod(int(duration_secs), 60)
+    m, s = divmod(int(recorded_secs), 60)
     try:
         result = process_with_claude(
             transcript=transcript,
             duration=f"{m}m {s}s",
-            timestamp=datetime.now().strftime("%Y-%m-%d %H:%M"),
+            timestamp=_note_timestamp(),
+            template=template,
         )
     except Exception as e:
         _auto_log(f"Claude processing failed: {e}")
@@ -527,6 +631,8 @@ def do_record_only(duration: int, meeting: str = ""):
 
 def audio_status():
     """Show current audio device configuration."""
+    from .audio_devices import resolve_recording_config, find_blackhole
+
     try:
         config = resolve_recording_config(AUDIO_DEVICE)
     except RuntimeError as e:
@@ -555,6 +661,8 @@ def audio_status():
 
 def audio_list_devices():
     """List all input-capable audio devices."""
+    from .audio_devices import query_input_devices, find_blackhole
+
     devices = query_input_devices()
     bh = find_blackhole()
     bh_idx = bh["index"] if bh else None
@@ -577,6 +685,8 @@ def audio_list_devices():
 
 def audio_setup():
     """Guided BlackHole setup for system audio capture."""
+    from .audio_devices import find_blackhole
+
     bh = find_blackhole()
     if not bh:
         print("Step 1: Install BlackHole\n")
@@ -601,6 +711,7 @@ def audio_setup():
 def audio_test():
     """Record 3 seconds and report audio levels."""
     import sounddevice as _sd
+    from .audio_devices import resolve_recording_config
 
     try:
         config = resolve_recording_config(AUDIO_DEVICE)
@@ -681,102 +792,98 @@ Audio is saved incrementally, so interrupted recordings can be recovered.
 """)
 
 
+CALENDAR_COMMANDS = {
+    "setup": calendar_setup,
+    "test": calendar_test,
+}
+
+MONITOR_COMMANDS = {
+    "enable": monitor_enable,
+    "disable": monitor_disable,
+    "status": monitor_status,
+}
+
+AUDIO_COMMANDS = {
+    "devices": audio_list_devices,
+    "setup": audio_setup,
+    "test": audio_test,
+}
+
+
+def _add_action_commands(parent, commands: dict, *, required: bool):
+    """Add a no-argument subcommand for each entry in a handler table."""
+    actions = parent.add_subparsers(dest="action", required=required)
+    for name, handler in commands.items():
+        actions.add_parser(name).set_defaults(func=lambda _args, fn=handler: fn())
+
+
+def _config_set_args(parser: argparse.ArgumentParser, args: argparse.Namespace):
+    """Run `config set`, requiring at least one value word."""
+    if not args.value:
+        parser.error("the following arguments are required: value")
+    config_set(args.key, " ".join(args.value))
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser (once per process)."""
+    parser = argparse.ArgumentParser(prog="kumbuka", add_help=False)
+    parser.set_defaults(func=lambda _args: do_record())
+    commands = parser.add_subparsers(dest="command")
+
+    recover = commands.add_parser("recover")
+    recover.add_argument("session", nargs="?")
+    recover.set_defaults(func=lambda args: do_recover(args.session))
+
+    record_only = commands.add_parser("record-only")
+    record_only.add_argument("--duration", type=int, required=True, metavar="SECONDS")
+    record_only.add_argument("--meeting", default="", metavar="TITLE")
+    record_only.set_defaults(
+        func=lambda args: do_record_only(args.duration, meeting=args.meeting)
+    )
+
+    calendar = commands.add_parser("calendar")
+    _add_action_commands(calendar, CALENDAR_COMMANDS, required=True)
+
+    monitor = commands.add_parser("monitor")
+    _add_action_commands(monitor, MONITOR_COMMANDS, required=True)
+
+    audio = commands.add_parser("audio")
+    audio.set_defaults(func=lambda _args: audio_status())
+    _add_action_commands(audio, AUDIO_COMMANDS, required=False)
+
+    config = commands.add_parser("config")
+    config.set_defaults(func=lambda _args: config_list())
+    config_actions = config.add_subparsers(dest="action")
+    config_get_cmd = config_actions.add_parser("get")
+    config_get_cmd.add_argument("key")
+    config_get_cmd.set_defaults(func=lambda args: config_get(args.key))
+    config_set_cmd = config_actions.add_parser("set")
+    config_set_cmd.add_argument("key")
+    # REMAINDER so values starting with "-" aren't parsed as options
+    config_set_cmd.add_argument("value", nargs=argparse.REMAINDER)
+    config_set_cmd.set_defaults(
+        func=lambda args: _config_set_args(config_set_cmd, args)
+    )
+
+    return parser
+
+
 def main():
     """Main entry point."""
     args = sys.argv[1:]
 
-    if args and (args[0] == "help" or args[0] == "--help" or args[0] == "-h"):
+    if args and args[0] in ("help", "--help", "-h"):
         print_usage()
         return
 
     if not args:
         # Default: record
         do_record()
-    elif args[0] == "recover":
-        # Recover interrupted recording
-        session = args[1] if len(args) > 1 else None
-        do_recover(session)
-    elif args[0] == "calendar":
-        if len(args) < 2:
-            print("Usage: kumbuka calendar [setup|test]")
-            sys.exit(1)
-
-        cmd = args[1]
-        if cmd == "setup":
-            calendar_setup()
-        elif cmd == "test":
-            calendar_test()
-        else:
-            print(f"Unknown calendar command: {cmd}")
-            sys.exit(1)
-    elif args[0] == "audio":
-        if len(args) < 2:
-            audio_status()
-        elif args[1] == "devices":
-            audio_list_devices()
-        elif args[1] == "setup":
-            audio_setup()
-        elif args[1] == "test":
-            audio_test()
-        else:
-            print(f"Unknown audio command: {args[1]}")
-            sys.exit(1)
-    elif args[0] == "config":
-        if len(args) < 2:
-            config_list()
-        elif args[1] == "set":
-            if len(args) < 4:
-                print("Usage: kumbuka config set <key> <value>")
-                sys.exit(1)
-            config_set(args[2], " ".join(args[3:]))
-        elif args[1] == "get":
-            if len(args) < 3:
-                print("Usage: kumbuka config get <key>")
-                sys.exit(1)
-            config_get(args[2])
-        else:
-            print(f"Unknown config command: {args[1]}")
-            sys.exit(1)
-    elif args[0] == "monitor":
-        if len(args) < 2:
-            print("Usage: kumbuka monitor [enable|disable|status]")
-            sys.exit(1)
+        return
 
-        cmd = args[1]
-        if cmd == "enable":
-            monitor_enable()
-        elif cmd == "disable":
-            monitor_disable()
-        elif cmd == "status":
-            monitor_status()
-        else:
-            print(f"Unknown monitor command: {cmd}")
-            sys.exit(1)
-    elif args[0] == "record-only":
-        duration = None
-        meeting = ""
-        i = 1
-        while i < len(args):
-            if args[i] == "--duration" and i + 1 < len(args):
-                try:
-                    duration = int(args[i + 1])
-                except ValueError:
-                    print(f"Invalid duration: {args[i + 1]}")
-                    sys.exit(1)
-                i += 2
-            elif args[i] == "--meeting" and i + 1 < len(args):
-                meeting = args[i + 1]
-                i += 2
-            else:
-                i += 1
-        if duration is None:
-            print("Usage: kumbuka record-only --duration SECONDS [--meeting TITLE]")
-            sys.exit(1)
-        do_record_only(duration, meeting=meeting)
-    else:
-        print(f"Unknown command: {args[0]}")
-        print_usage()
-        sys.exit(1)
+    parsed = _build_parser().parse_args(args)
+    parsed.func(parsed)
 
 
 if __name__ == "__main__":
@@ -6,6 +6,7 @@ from [data-eventchip] elements in the Google Calendar Schedule view.
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import logging
 import re
@@ -19,17 +20,26 @@ __all__ = [
     "ensure_kumbuka_calendar_tab",
     "get_upcoming_events",
     "get_current_meetings",
+    "get_meetings",
+    "get_next_event_start",
     "is_authenticated",
 ]
 
+try:
+    from AppKit import NSDate, NSRunLoop, NSRunningApplication  # PyObjC, optional
+except ImportError:  # pragma: no cover - missing or broken PyObjC falls back to osascript
+    NSRunningApplication = None
+
 log = logging.getLogger(__name__)
 
 CALENDAR_URL = "https://calendar.google.com/calendar/u/0/r/custom/2/d"
 CALENDAR_ORIGIN = "calendar.google.com"
+CHROME_BUNDLE_ID = "com.google.Chrome"
 SEPARATOR = "\n---KUMBUKA_SEP---\n"
 DEFAULT_CALENDAR_NAME = "Google Calendar"
 PAGE_LOAD_TIMEOUT_S = 10
-PAGE_LOAD_POLL_INTERVAL_S = 1
+PAGE_LOAD_POLL_INTERVAL_S = 1  # longest gap between load checks
+PAGE_LOAD_FIRST_POLL_S = 0.1
 
 MONTH_NAMES = (
     "January", "February", "March", "April", "May", "June",
@@ -50,6 +60,8 @@ _TIME_RANGE_RE = re.compile(
     r"^(\d{1,2}(?::\d{2})?\s*[AP]M)\s+to\s+(\d{1,2}(?::\d{2})?\s*[AP]M)$",
     re.IGNORECASE,
 )
+# A single 12-hour clock time: "10:00 AM", "2 PM", "5pm"
+_CLOCK_TIME_RE = re.compile(r"^(\d{1,2})(?::(\d{2}))?\s*([APap][Mm])$")
 
 # Date patterns:
 # "March 20, 2026"
@@ -159,7 +171,19 @@ def _run_js_in_tab(js: str, window_id: int, tab_index: int) -> str:
 # ---------------------------------------------------------------------------
 
 def _chrome_is_running() -> bool:
-    """Return True if Google Chrome is currently running."""
+    """Return True if Google Chrome is currently running.
+
+    Asks NSRunningApplication in-process when PyObjC is available, which
+    avoids an osascript spawn and a System Events round trip per poll.
+    """
+    if NSRunningApplication is not None:
+        # The running-application list is only refreshed as the run loop
+        # turns; the monitor just sleeps between polls, so turn it here or
+        # the answer goes stale after Chrome quits or launches
+        NSRunLoop.currentRunLoop().runUntilDate_(NSDate.date())
+        return bool(
+            NSRunningApplication.runningApplicationsWithBundleIdentifier_(CHROME_BUNDLE_ID)
+        )
     try:
         result = _run_applescript(
             'tell application "System Events" to '
@@ -189,35 +213,38 @@ def _find_calendar_tab() -> tuple[int, int] | None:
     """Search all Chrome windows/tabs for one on calendar.google.com.
 
     Prefers a tab already at CALENDAR_URL (the correct view) over any other
-    calendar tab.  Returns the best match.
+    calendar tab.  Returns the best match.  All windows are listed in a
+    single osascript call as "<window id>\t<tab index>\t<url>" lines.
     """
     try:
-        win_ids_raw = _run_applescript(
-            'tell application "Google Chrome" to return id of every window'
+        raw = _run_applescript(
+            "set sep to character id 9\n"
+            "set out to \"\"\n"
+            'tell application "Google Chrome"\n'
+            "    repeat with w in windows\n"
+            "        set wid to id of w as text\n"
+            "        set i to 0\n"
+            "        repeat with u in (URL of every tab of w)\n"
+            "            set i to i + 1\n"
+            "            set out to out & wid & sep & i & sep & u & linefeed\n"
+            "        end repeat\n"
+            "    end repeat\n"
+            "end tell\n"
+            "return out"
         )
-        if not win_ids_raw:
+        if not raw:
             return None
 
         best: tuple[int, int] | None = None
-        for win_id_str in win_ids_raw.split(", "):
-            win_id_str = win_id_str.strip()
-            if not win_id_str:
+        for line in raw.splitlines():
+            parts = line.split("\t", 2)
+            if len(parts) != 3:
                 continue
-            win_id = int(win_id_str)
-
-            urls_raw = _run_applescript(
-                'tell application "Google Chrome"\n'
-                f"    tell window id {win_id}\n"
-                "        URL of every tab\n"
-                "    end tell\n"
-                "end tell"
-            )
-            urls = [u.strip() for u in urls_raw.split(", ")]
-            for idx, url in enumerate(urls, 1):
-                if CALENDAR_URL in url:
-                    return (win_id, idx)  # exact match — use immediately
-                if f"https://{CALENDAR_ORIGIN}" in url and best is None:
-                    best = (win_id, idx)
+            win_id, idx, url = int(parts[0]), int(parts[1]), parts[2]
+            if CALENDAR_URL in url:
+                return (win_id, idx)  # exact match — use immediately
+            if f"https://{CALENDAR_ORIGIN}" in url and best is None:
+                best = (win_id, idx)
 
         return best
     except (subprocess.CalledProcessError, ValueError):
@@ -225,8 +252,13 @@ def _find_calendar_tab() -> tuple[int, int] | None:
 
 
 def _wait_for_tab_load(window_id: int, tab_index: int) -> bool:
-    """Poll until the tab finishes loading or the timeout is reached."""
+    """Poll until the tab finishes loading or the timeout is reached.
+
+    Polls quickly at first and backs off to PAGE_LOAD_POLL_INTERVAL_S, so
+    a tab that is already loaded doesn't cost a full interval.
+    """
     deadline = time.monotonic() + PAGE_LOAD_TIMEOUT_S
+    delay = PAGE_LOAD_FIRST_POLL_S
     while time.monotonic() < deadline:
         try:
             loading = _run_applescript(
@@ -240,7 +272,8 @@ def _wait_for_tab_load(window_id: int, tab_index: int) -> bool:
                 return True
         except subprocess.CalledProcessError:
             pass
-        time.sleep(PAGE_LOAD_POLL_INTERVAL_S)
+        time.sleep(delay)
+        delay = min(delay * 2, PAGE_LOAD_POLL_INTERVAL_S)
     return False
 
 
@@ -452,23 +485,24 @@ def _local_tz():
 
 
 def _parse_time(time_str: str, ref_date: datetime) -> datetime:
-    """Parse a time string like '10:00 AM', '2 PM', or '5pm' into a datetime on ref_date."""
-    time_str = time_str.strip()
-    # Normalize compact forms: "5pm" -> "5:00 PM", "11:30am" -> "11:30 AM"
-    m = re.match(r"^(\d{1,2})(?::(\d{2}))?\s*([APap][Mm])$", time_str)
-    if m:
-        hour = m.group(1)
-        mins = m.group(2) or "00"
-        ampm = m.group(3).upper()
-        time_str = f"{hour}:{mins} {ampm}"
-    elif ":" not in time_str.split()[0]:
-        # "2 PM" -> "2:00 PM"
-        parts = time_str.split()
-        time_str = parts[0] + ":00 " + parts[1]
-    parsed = datetime.strptime(time_str, "%I:%M %p")
+    """Parse a time string like '10:00 AM', '2 PM', or '5pm' into a datetime on ref_date.
+
+    Raises ValueError for anything that isn't a 12-hour clock time.
+    """
+    m = _CLOCK_TIME_RE.match(time_str.strip())
+    if not m:
+        raise ValueError(f"Unrecognized time: {time_str!r}")
+    hour = int(m.group(1))
+    minute = int(m.group(2) or 0)
+    if not 1 <= hour <= 12 or minute > 59:
+        raise ValueError(f"Unrecognized time: {time_str!r}")
+    # 12 AM is midnight and 12 PM is noon
+    hour %= 12
+    if m.group(3).upper() == "PM":
+        hour += 12
     return ref_date.replace(
-        hour=parsed.hour,
-        minute=parsed.minute,
+        hour=hour,
+        minute=minute,
         second=0,
         microsecond=0,
     )
@@ -506,6 +540,12 @@ def _parse_date_token(token: str) -> tuple[datetime, datetime | None] | None:
     Returns (start_date, end_date) where end_date is None for single dates.
     Dates are returned as timezone-aware datetimes at midnight.
     """
+    # Every date pattern starts with a month name; most tokens are titles
+    # or participants, so reject them before trying three regexes
+    words = token.split(None, 1)
+    if not words or words[0] not in _MONTH_LOOKUP:
+        return None
+
     tz = _local_tz()
 
     m = _SINGLE_DATE_RE.match(token)
@@ -542,16 +582,19 @@ def _parse_date_token(token: str) -> tuple[datetime, datetime | None] | None:
     return None
 
 
+_MIDNIGHT_TIMES = frozenset({"12 AM", "12:00 AM"})
+_END_OF_DAY_TIMES = frozenset({
+    "11:59 PM", "11:30 PM", "12 AM", "12:00 AM",
+    "11:59PM", "11:30PM", "12AM", "12:00AM",
+})
+
+
 def _is_full_day_time_range(start_str: str, end_str: str) -> bool:
     """Return True if a time range spans the full day (e.g. 12 AM to 11:59 PM)."""
-    start_str = start_str.strip().upper()
-    end_str = end_str.strip().upper()
-    start_is_midnight = start_str in ("12 AM", "12:00 AM")
-    end_is_late = end_str in (
-        "11:59 PM", "11:30 PM", "12 AM", "12:00 AM",
-        "11:59PM", "11:30PM", "12AM", "12:00AM",
+    return (
+        start_str.strip().upper() in _MIDNIGHT_TIMES
+        and end_str.strip().upper() in _END_OF_DAY_TIMES
     )
-    return start_is_midnight and end_is_late
 
 
 def _parse_aria_label(label: str, *, datekey: str | None = None) -> CalendarEvent | None:
@@ -698,8 +741,20 @@ _DATEKEY_SEP = "|||"
 _CONFIRM_DELAY_S = 1.5
 
 
+@functools.lru_cache(maxsize=512)
+def _parse_label_cached(label: str, datekey: str | None, _day, _tz) -> CalendarEvent | None:
+    """Memoized _parse_aria_label.
+
+    The same chips are scraped on every poll; labels without a date resolve
+    against today, so the cache is keyed by the current day and timezone too.
+    """
+    return _parse_aria_label(label, datekey=datekey)
+
+
 def _parse_raw_labels(raw_labels: list[str]) -> list[CalendarEvent]:
     """Parse a list of raw aria-label strings into CalendarEvents."""
+    tz = _local_tz()
+    today = datetime.now(tz=tz).date()
     events: list[CalendarEvent] = []
     for raw in raw_labels:
         datekey: str | None = None
@@ -711,7 +766,7 @@ def _parse_raw_labels(raw_labels: list[str]) -> list[CalendarEvent]:
                 datekey = rest[:sep_idx]
                 label = rest[sep_idx + len(_DATEKEY_SEP):]
 
-        event = _parse_aria_label(label, datekey=datekey)
+        event = _parse_label_cached(label, datekey, today, tz)
         if event is not None:
             events.append(event)
         else:
@@ -719,7 +774,31 @@ def _parse_raw_labels(raw_labels: list[str]) -> list[CalendarEvent]:
     return events
 
 
+_EVENTS_TTL_S = 30
+
+# (monotonic time of scrape, events) from the last _extract_events call.
+_events_cache: tuple[float, list[CalendarEvent]] | None = None
+
+
 def _extract_events() -> list[CalendarEvent]:
+    """Return all calendar events, re-scraping at most every _EVENTS_TTL_S.
+
+    get_upcoming_events() and get_current_meetings() are called back to back
+    on every monitor check; the cache lets the second call reuse the first
+    call's scrape instead of repeating the double scrape and its delay.
+    """
+    global _events_cache  # noqa: PLW0603
+
+    now = time.monotonic()
+    if _events_cache is not None and now - _events_cache[0] < _EVENTS_TTL_S:
+        return list(_events_cache[1])
+
+    events = _scrape_events()
+    _events_cache = (now, events)
+    return list(events)
+
+
+def _scrape_events() -> list[CalendarEvent]:
     """Open/find the calendar tab, scrape, and parse all events.
 
     Performs a confirmation scrape: scrapes twice with a short delay and
@@ -734,6 +813,10 @@ def _extract_events() -> list[CalendarEvent]:
     _refresh_calendar_tab(window_id, tab_index)
 
     first_labels = _scrape_aria_labels(window_id, tab_index)
+    if not first_labels:
+        # Nothing to confirm: the intersection with a second scrape is empty too
+        return []
+
     time.sleep(_CONFIRM_DELAY_S)
     second_labels = _scrape_aria_labels(window_id, tab_index)
 
@@ -751,18 +834,25 @@ def _extract_events() -> list[CalendarEvent]:
 # Public API
 # ---------------------------------------------------------------------------
 
+def _partition_events(
+    events: list[CalendarEvent], now: datetime, minutes_ahead: int
+) -> tuple[list[CalendarEvent], list[CalendarEvent]]:
+    """Split events into (upcoming, current), each sorted by start time."""
+    cutoff = now + timedelta(minutes=minutes_ahead)
+    upcoming = [e for e in events if now <= e.start <= cutoff]
+    current = [e for e in events if not e.is_all_day and e.start <= now <= e.end]
+    upcoming.sort(key=lambda e: e.start)
+    current.sort(key=lambda e: e.start)
+    return upcoming, current
+
+
 def get_upcoming_events(minutes_ahead: int = 5) -> list[CalendarEvent]:
     """Return events starting between now and now + minutes_ahead.
 
     All-day events are included only if they start within the window.
     """
     now = datetime.now(tz=_local_tz())
-    cutoff = now + timedelta(minutes=minutes_ahead)
-
-    events = _extract_events()
-    upcoming = [e for e in events if now <= e.start <= cutoff]
-    upcoming.sort(key=lambda e: e.start)
-    return upcoming
+    return _partition_events(_extract_events(), now, minutes_ahead)[0]
 
 
 def get_current_meetings() -> list[CalendarEvent]:
@@ -771,11 +861,28 @@ def get_current_meetings() -> list[CalendarEvent]:
     All-day events are excluded (consistent with original calendar.py behavior).
     """
     now = datetime.now(tz=_local_tz())
+    return _partition_events(_extract_events(), now, 0)[1]
 
-    events = _extract_events()
-    current = [e for e in events if not e.is_all_day and e.start <= now <= e.end]
-    current.sort(key=lambda e: e.start)
-    return current
+
+def get_meetings(
+    minutes_ahead: int = 5,
+) -> tuple[list[CalendarEvent], list[CalendarEvent]]:
+    """Return (upcoming, current) events from one scrape and one clock reading.
+
+    Same filters as get_upcoming_events() and get_current_meetings().
+    """
+    now = datetime.now(tz=_local_tz())
+    return _partition_events(_extract_events(), now, minutes_ahead)
+
+
+def get_next_event_start(minutes_ahead: int = 5) -> datetime | None:
+    """Return when the first timed event after now + minutes_ahead starts.
+
+    Returns None if no such event is on the scraped calendar.
+    """
+    after = datetime.now(tz=_local_tz()) + timedelta(minutes=minutes_ahead)
+    starts = [e.start for e in _extract_events() if not e.is_all_day and e.start > after]
+    return min(starts, default=None)
 
 
 def is_authenticated() -> bool:
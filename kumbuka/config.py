@@ -87,5 +87,14 @@ AUTO_RECORD = os.getenv("KUMBUKA_AUTO_RECORD", "true").lower() in ("true", "1",
 # Buffer minutes added after meeting end
 BUFFER_MINUTES = int(os.getenv("KUMBUKA_BUFFER_MINUTES", "10"))
 
+# Monitor poll interval bounds (seconds): polls run every MIN while meetings
+# are around and back off towards MAX while the calendar is quiet
+MONITOR_MIN_INTERVAL = int(os.getenv("KUMBUKA_MONITOR_MIN_INTERVAL", "60"))
+MONITOR_MAX_INTERVAL = int(os.getenv("KUMBUKA_MONITOR_MAX_INTERVAL", "300"))
+
+# launchd ProcessType for the monitor; "Interactive" avoids background
+# CPU/IO throttling of the recordings it starts ("Background" to opt in)
+MONITOR_PROCESS_TYPE = os.getenv("KUMBUKA_MONITOR_PROCESS_TYPE", "Interactive")
+
 # User identification (for personalized feedback)
 USER_NAME = os.getenv("KUMBUKA_USER_NAME", "Me")
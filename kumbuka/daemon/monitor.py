@@ -7,12 +7,32 @@ Detects meetings via Calendar scraper and auto-records or prompts to record.
 
 import subprocess
 import json
+import os
+import random
 import sys
+import time
 from datetime import datetime
 
-from kumbuka.config import OUTPUT_DIR, LOG_DIR, PROMPT_MINUTES, AUTO_RECORD, BUFFER_MINUTES
+from kumbuka.config import (
+    OUTPUT_DIR, LOG_DIR, PROMPT_MINUTES, AUTO_RECORD, BUFFER_MINUTES,
+    MONITOR_MIN_INTERVAL, MONITOR_MAX_INTERVAL,
+)
 from kumbuka.runtime import find_python
 
+try:
+    # PyObjC (optional "macos" extra): native record prompt without osascript
+    from AppKit import (
+        NSAlert,
+        NSAlertFirstButtonReturn,
+        NSApplication,
+        NSApplicationActivationPolicyAccessory,
+        NSModalPanelRunLoopMode,
+        NSRunLoop,
+        NSTimer,
+    )
+except ImportError:  # pragma: no cover - missing or broken PyObjC falls back to osascript
+    NSAlert = None
+
 LOG_FILE = LOG_DIR / "monitor.log"
 PROMPTED_FILE = OUTPUT_DIR / "prompted_meetings.json"
 
@@ -40,28 +60,102 @@ def log(msg: str):
         f.write(f"{datetime.now()}: {msg}\n")
 
 
-def load_prompted() -> set:
-    """Load set of already-prompted meeting IDs."""
+PROMPTED_TTL_S = 86400  # 24 hours
+
+# Prompted meeting IDs -> time first prompted, kept for the life of the daemon
+# process.  Reloaded only when the file's mtime differs from the last
+# load/save (e.g. it was cleared by hand while the daemon was running).
+_prompted: dict[str, float] | None = None
+_prompted_mtime_ns: int | None = None
+
+
+def _prompted_file_mtime_ns() -> int | None:
+    try:
+        return PROMPTED_FILE.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def load_prompted() -> dict[str, float]:
+    """Load already-prompted meeting IDs with the time they were prompted."""
     if PROMPTED_FILE.exists():
         try:
             data = json.loads(PROMPTED_FILE.read_text(encoding="utf-8"))
-            cutoff = datetime.now().timestamp() - 86400  # 24 hours
-            return {k for k, v in data.items() if v > cutoff}
+            cutoff = time.time() - PROMPTED_TTL_S
+            return {k: v for k, v in data.items() if v > cutoff}
         except Exception:
             pass
-    return set()
+    return {}
 
 
-def save_prompted(prompted: set):
-    """Save prompted meeting IDs with timestamps."""
+def save_prompted(prompted: dict[str, float]):
+    """Save prompted meeting IDs with timestamps.
+
+    Written to a temp file and swapped in, so a crash mid-write can't leave
+    a truncated file that load_prompted would discard.
+    """
+    global _prompted_mtime_ns  # noqa: PLW0603
     PROMPTED_FILE.parent.mkdir(parents=True, exist_ok=True)
-    data = {mid: datetime.now().timestamp() for mid in prompted}
-    PROMPTED_FILE.write_text(json.dumps(data), encoding="utf-8")
+    tmp = PROMPTED_FILE.with_name(PROMPTED_FILE.name + ".tmp")
+    tmp.write_text(json.dumps(prompted), encoding="utf-8")
+    os.replace(tmp, PROMPTED_FILE)
+    _prompted_mtime_ns = _prompted_file_mtime_ns()
+
+
+def _get_prompted() -> dict[str, float]:
+    """Return the in-memory prompted map, dropping entries older than the TTL."""
+    global _prompted, _prompted_mtime_ns  # noqa: PLW0603
+    mtime_ns = _prompted_file_mtime_ns()
+    if _prompted is None or mtime_ns != _prompted_mtime_ns:
+        _prompted = load_prompted()
+        _prompted_mtime_ns = mtime_ns
+        return _prompted
+
+    cutoff = time.time() - PROMPTED_TTL_S
+    for mid in [k for k, v in _prompted.items() if v <= cutoff]:
+        del _prompted[mid]
+    return _prompted
+
+
+DIALOG_TIMEOUT_S = 30
+
+# Escapes for interpolating a title into an AppleScript string literal
+_APPLESCRIPT_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "'": "\u2019"})
+
+
+def _show_native_dialog(title: str) -> bool:
+    """Ask via an in-process NSAlert; gives up (Skip) after DIALOG_TIMEOUT_S."""
+    app = NSApplication.sharedApplication()
+    # Accessory: can show windows without a Dock icon or menu bar
+    app.setActivationPolicy_(NSApplicationActivationPolicyAccessory)
+
+    alert = NSAlert.alloc().init()
+    alert.setMessageText_(f"Meeting: {title}")
+    alert.setInformativeText_("Would you like to record?")
+    alert.addButtonWithTitle_("Record")
+    alert.addButtonWithTitle_("Skip")
+    alert.window().setTitle_("Kumbuka")
+
+    timer = NSTimer.timerWithTimeInterval_repeats_block_(
+        DIALOG_TIMEOUT_S, False, lambda _timer: app.abortModal()
+    )
+    NSRunLoop.currentRunLoop().addTimer_forMode_(timer, NSModalPanelRunLoopMode)
+    app.activateIgnoringOtherApps_(True)
+    try:
+        return alert.runModal() == NSAlertFirstButtonReturn
+    finally:
+        timer.invalidate()
 
 
 def show_record_dialog(title: str) -> bool:
     """Show dialog asking if user wants to record."""
-    safe_title = title.replace('"', '\\"').replace("'", "\u2019")
+    if NSAlert is not None:
+        try:
+            return _show_native_dialog(title)
+        except Exception as e:
+            log(f"Native dialog failed, falling back to osascript: {e}")
+
+    safe_title = title.translate(_APPLESCRIPT_ESCAPES)
 
     script = f'''
 tell application "System Events"
@@ -70,7 +164,7 @@ tell application "System Events"
     set msg to msg & "Would you like to record?"
 
     set dialogResult to display dialog msg buttons {{"Skip", "Record"}} \u00ac
-        default button "Record" with title "Kumbuka" giving up after 30
+        default button "Record" with title "Kumbuka" giving up after {DIALOG_TIMEOUT_S}
 
     if button returned of dialogResult is "Record" then
         return "yes"
@@ -83,9 +177,10 @@ end tell
     try:
         result = subprocess.run(
             ["osascript", "-e", script],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
-            timeout=35,
+            timeout=DIALOG_TIMEOUT_S + 5,
             check=False
         )
         return result.stdout.strip() == "yes"
@@ -139,7 +234,8 @@ def start_auto_recording(event):
     with open(auto_log, "a") as log_fh:
         subprocess.Popen(
             [python_path, "-m", "kumbuka", "record-only",
-             "--duration", str(duration), "--meeting", event.title],
+             # One argument, so a title starting with "-" isn't read as an option
+             "--duration", str(duration), f"--meeting={event.title}"],
             stdout=log_fh,
             stderr=subprocess.STDOUT,
             close_fds=True,
@@ -149,13 +245,36 @@ def start_auto_recording(event):
 MAX_RETRIES = 2
 RETRY_DELAY_S = 5
 
+# Start of the next timed event beyond the prompt window, as of the last
+# successful check; bounds how long run_forever sleeps.
+_next_event_start: datetime | None = None
+
 
-def check_calendar():
+def check_calendar() -> int:
     """Check calendar and auto-record or prompt if meeting found.
 
     Retries up to MAX_RETRIES times on transient failures (Chrome unresponsive,
     AppleScript timeouts after wake-from-sleep, etc.).
+
+    In auto-record mode the scrape is skipped while a recording is already
+    running, since no new recording could start anyway; events that are
+    still current afterwards are picked up by the next check.
+
+    Returns the number of upcoming/current events seen (0 if every attempt
+    failed).  A skipped check counts as one event so polling stays at the
+    minimum interval until the recording ends.
     """
+    global _next_event_start  # noqa: PLW0603
+    _next_event_start = None
+
+    if AUTO_RECORD:
+        from kumbuka.recording_lock import get_active_recording
+
+        active = get_active_recording()
+        if active is not None:
+            log(f"Recording in progress ({active.mode}, PID {active.pid}) — skipping check")
+            return 1
+
     last_error = None
     for attempt in range(1 + MAX_RETRIES):
         try:
@@ -163,24 +282,27 @@ def check_calendar():
         except Exception as e:
             last_error = e
             if attempt < MAX_RETRIES:
-                import time as _time
                 log(f"Calendar check failed (attempt {attempt + 1}): {e} — retrying in {RETRY_DELAY_S}s")
-                _time.sleep(RETRY_DELAY_S)
+                time.sleep(RETRY_DELAY_S)
 
     log(f"Calendar check failed after {1 + MAX_RETRIES} attempts: {last_error}")
-    return False
+    return 0
 
 
-def _check_calendar_once():
+def _check_calendar_once() -> int:
     """Single attempt to check the calendar and act on events."""
-    from kumbuka.calendar_scraper import get_upcoming_events, get_current_meetings
-    from kumbuka.meeting_filter import should_record
+    global _next_event_start  # noqa: PLW0603
+    from kumbuka.calendar_scraper import get_meetings, get_next_event_start
+    from kumbuka.meeting_filter import classify_events
 
-    prompted = load_prompted()
+    prompted = _get_prompted()
 
     # Deduplicate: same event can appear in both upcoming and current lists
     # with different IDs if the textContent varies between scrapes.
-    all_events = get_upcoming_events(PROMPT_MINUTES) + get_current_meetings()
+    upcoming, current = get_meetings(PROMPT_MINUTES)
+    # Served from the same scrape (calendar_scraper caches it briefly)
+    _next_event_start = get_next_event_start(PROMPT_MINUTES)
+    all_events = upcoming + current
     seen_titles = set()
     events = []
     for e in all_events:
@@ -189,26 +311,32 @@ def _check_calendar_once():
             seen_titles.add(key)
             events.append(e)
 
-    for event in events:
-        if event.id in prompted:
-            continue
+    new_events = [e for e in events if e.id not in prompted]
+    # Classify every new event up front (ambiguous ones go to Claude in parallel)
+    decisions = classify_events(new_events) if new_events else {}
 
-        if not should_record(event):
-            log(f"Skipping: {event.title}")
-            prompted.add(event.id)
+    # Only touch the prompted file when this check added something
+    dirty = False
+    now = time.time()
+    try:
+        for event in new_events:
+            prompted[event.id] = now
+            dirty = True
+
+            if not decisions.get(event.id, True):
+                log(f"Skipping: {event.title}")
+                continue
+
+            if AUTO_RECORD:
+                log(f"Auto-recording: {event.title}")
+                start_auto_recording(event)
+            else:
+                log(f"Meeting detected: {event.title}")
+                if show_record_dialog(f"{event.title} (starting soon)"):
+                    start_recording_in_terminal()
+    finally:
+        if dirty:
             save_prompted(prompted)
-            continue
-
-        prompted.add(event.id)
-        save_prompted(prompted)
-
-        if AUTO_RECORD:
-            log(f"Auto-recording: {event.title}")
-            start_auto_recording(event)
-        else:
-            log(f"Meeting detected: {event.title}")
-            if show_record_dialog(f"{event.title} (starting soon)"):
-                start_recording_in_terminal()
 
     event_count = len(events)
     if event_count > 0:
@@ -216,22 +344,63 @@ def _check_calendar_once():
     else:
         log("Checked - no meetings")
 
-    return False
+    return event_count
+
+
+JITTER = 0.1  # +/-10% on each sleep
+MIN_SLEEP_S = 5
+
+
+def _next_interval(current: float, saw_events: bool, min_interval: float, max_interval: float) -> float:
+    """Poll at min_interval around meetings; double (up to max_interval) while idle."""
+    if saw_events:
+        return min_interval
+    return min(current * 2, max_interval)
+
+
+def _bound_by_next_event(delay: float) -> float:
+    """Shorten *delay* so the loop wakes as the next event enters the prompt window."""
+    if _next_event_start is None:
+        return delay
+    now = datetime.now(_next_event_start.tzinfo)
+    until_window = (_next_event_start - now).total_seconds() - PROMPT_MINUTES * 60
+    return min(delay, max(until_window, MIN_SLEEP_S))
+
+
+def run_forever(
+    min_interval: float = MONITOR_MIN_INTERVAL,
+    max_interval: float = MONITOR_MAX_INTERVAL,
+):
+    """Check the calendar until the process is stopped.
+
+    Errors are logged and never end the loop, so one bad poll doesn't make
+    launchd restart the whole process.  Sleeps are jittered so polls don't
+    fall into lockstep with other periodic work, and cut short when the next
+    known meeting would otherwise enter the prompt window mid-sleep.
+    """
+    max_interval = max(min_interval, max_interval)
+    interval = min_interval
+    while True:
+        seen = 0
+        try:
+            seen = check_calendar()
+        except Exception as e:
+            try:
+                log(f"Unhandled error in monitor: {e}")
+            except Exception:
+                pass
+        interval = _next_interval(interval, seen > 0, min_interval, max_interval)
+        delay = interval * random.uniform(1 - JITTER, 1 + JITTER)
+        time.sleep(_bound_by_next_event(delay))
 
 
 def main():
     """Entry point for daemon.
 
-    Always exits 0 so launchd doesn't throttle the job due to repeated
-    non-zero exit codes.  All errors are captured in the monitor log.
+    Runs as one resident process (launchd KeepAlive) so the interpreter,
+    imports and the Chrome tab reference are reused across polls.
     """
-    try:
-        check_calendar()
-    except Exception as e:
-        try:
-            log(f"Unhandled error in monitor: {e}")
-        except Exception:
-            pass
+    run_forever()
 
 
 if __name__ == "__main__":
@@ -2,9 +2,12 @@
 
 import re
 
+_UNSAFE_CHARS = re.compile(r"[^a-z0-9-]")
+_DASH_RUNS = re.compile(r"-+")
+
 
 def sanitize_filename(name: str) -> str | None:
     """Sanitize a string into a filesystem-safe filename."""
-    name = re.sub(r"[^a-z0-9-]", "-", name.lower())
-    name = re.sub(r"-+", "-", name).strip("-")
+    name = _UNSAFE_CHARS.sub("-", name.lower())
+    name = _DASH_RUNS.sub("-", name).strip("-")
     return name[:60] if name else None
@@ -7,14 +7,15 @@ rules first, then falls back to Claude CLI classification for ambiguous events.
 import json
 import logging
 import re
-import shutil
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 from .calendar_scraper import CalendarEvent
 from .config import OUTPUT_DIR
+from .runtime import find_claude
 
-__all__ = ["should_record"]
+__all__ = ["classify_events", "should_record"]
 
 log = logging.getLogger(__name__)
 
@@ -90,10 +91,15 @@ def _deterministic_classify(event: CalendarEvent) -> str | None:
     return None
 
 
+_MAX_CLAUDE_WORKERS = 4
+
+
 def _classify_with_claude(event: CalendarEvent) -> str:
     """Use Claude CLI to classify an ambiguous event."""
-    claude_path = shutil.which("claude")
+    claude_path = find_claude()
     if not claude_path:
+        # Forget the miss so an install is picked up by the resident monitor
+        find_claude.cache_clear()
         log.warning("Claude CLI not found on PATH; defaulting to RECORD")
         return "RECORD"
 
@@ -116,7 +122,8 @@ def _classify_with_claude(event: CalendarEvent) -> str:
     try:
         result = subprocess.run(
             [claude_path, "--print", "-m", "haiku", prompt],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
             timeout=15,
         )
@@ -134,32 +141,61 @@ def _classify_with_claude(event: CalendarEvent) -> str:
         return "RECORD"
 
 
-def should_record(event: CalendarEvent) -> bool:
-    """Decide whether a calendar event should be recorded.
+def classify_events(events: list[CalendarEvent]) -> dict[str, bool]:
+    """Decide which of several calendar events should be recorded.
 
-    Checks the cache first, then applies deterministic rules, and finally
-    falls back to Claude CLI classification for ambiguous events.
+    Same rules as should_record(), but the cache is read and written once
+    and ambiguous events are classified by Claude concurrently.  Returns a
+    mapping of event ID to record decision; on error, every event not yet
+    decided defaults to True.
     """
+    decisions: dict[str, bool] = {}
     try:
         cache = _load_cache()
-
-        cached = cache.get(event.id)
-        if cached is not None:
-            log.debug("Cache hit for %s: %s", event.id, cached["result"])
-            return cached["result"] == "RECORD"
-
-        result = _deterministic_classify(event)
-        if result is not None:
+        now = time.time()
+        changed = False
+        ambiguous: list[CalendarEvent] = []
+
+        for event in events:
+            cached = cache.get(event.id)
+            if cached is not None:
+                log.debug("Cache hit for %s: %s", event.id, cached["result"])
+                decisions[event.id] = cached["result"] == "RECORD"
+                continue
+
+            result = _deterministic_classify(event)
+            if result is None:
+                ambiguous.append(event)
+                continue
             log.debug("Deterministic classification for '%s': %s", event.title, result)
-            cache[event.id] = {"result": result, "timestamp": time.time()}
+            cache[event.id] = {"result": result, "timestamp": now}
+            decisions[event.id] = result == "RECORD"
+            changed = True
+
+        if ambiguous:
+            workers = min(len(ambiguous), _MAX_CLAUDE_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = pool.map(_classify_with_claude, ambiguous)
+                for event, result in zip(ambiguous, results):
+                    log.debug("Claude classification for '%s': %s", event.title, result)
+                    cache[event.id] = {"result": result, "timestamp": now}
+                    decisions[event.id] = result == "RECORD"
+            changed = True
+
+        if changed:
             _save_cache(cache)
-            return result == "RECORD"
-
-        result = _classify_with_claude(event)
-        log.debug("Claude classification for '%s': %s", event.title, result)
-        cache[event.id] = {"result": result, "timestamp": time.time()}
-        _save_cache(cache)
-        return result == "RECORD"
     except Exception:
-        log.exception("Classification failed for '%s'; defaulting to RECORD", event.title)
-        return True
+        log.exception("Classification failed; defaulting undecided events to RECORD")
+        for event in events:
+            decisions.setdefault(event.id, True)
+
+    return decisions
+
+
+def should_record(event: CalendarEvent) -> bool:
+    """Decide whether a calendar event should be recorded.
+
+    Checks the cache first, then applies deterministic rules, and finally
+    falls back to Claude CLI classification for ambiguous events.
+    """
+    return classify_events([event])[event.id]
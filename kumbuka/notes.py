@@ -1,5 +1,6 @@
 """Note destination selection and save helpers."""
 
+import importlib
 from typing import Optional
 
 VALID_DESTINATIONS = {"terminal", "notion", "obsidian"}
@@ -28,6 +29,21 @@ def resolve_destination(
     return "terminal"
 
 
+def preload_backend(destination: str, *, notion_mode: str = "token") -> None:
+    """Import the destination's heavy dependencies ahead of saving.
+
+    Lets callers pay the import cost while other work (e.g. transcription)
+    is still running. Missing dependencies are ignored here and reported
+    by :func:`save_meeting_notes` instead.
+    """
+    if destination == "notion" and notion_mode == "token":
+        importlib.import_module(".notion", __package__)
+        try:
+            importlib.import_module("httpx")
+        except ModuleNotFoundError:
+            pass
+
+
 def save_meeting_notes(
     result: dict,
     *,
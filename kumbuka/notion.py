@@ -1,5 +1,6 @@
 """Notion API wrapper for creating meeting pages."""
 
+import functools
 import os
 import re
 from typing import Optional
@@ -7,14 +8,28 @@ from typing import Optional
 NOTION_API_URL = "https://api.notion.com/v1"
 NOTION_VERSION = "2022-06-28"
 
+_URL_PAGE_ID_RE = re.compile(r"([a-f0-9]{32})$")
+_DASHED_PAGE_ID_RE = re.compile(r"[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}")
 
-def _httpx():
-    """Import httpx lazily so non-Notion tests don't require it."""
-    try:
-        import httpx
-    except ModuleNotFoundError as exc:
-        raise RuntimeError("httpx is required for Notion integration") from exc
-    return httpx
+
+# Shared client so a page create plus its block appends reuse one
+# keep-alive connection instead of a new TCP+TLS handshake per request.
+_client_instance = None
+
+
+def _client():
+    """Return the shared httpx client, importing httpx lazily on first use."""
+    global _client_instance  # pylint: disable=global-statement
+    if _client_instance is None:
+        try:
+            import httpx
+        except ModuleNotFoundError as exc:
+            raise RuntimeError("httpx is required for Notion integration") from exc
+        _client_instance = httpx.Client(
+            limits=httpx.Limits(max_keepalive_connections=4),
+            timeout=30.0,
+        )
+    return _client_instance
 
 
 def get_token() -> str:
@@ -28,6 +43,30 @@ def get_token() -> str:
     return token
 
 
+_MAX_CHILDREN = 100  # Notion limit per append/create request
+
+
+def _append_children(page_uuid: str, blocks: list, headers: dict) -> dict:
+    """PATCH blocks onto a page in _MAX_CHILDREN chunks; returns the last response.
+
+    Chunks are sent one after another: each append lands at the end of the
+    page, so concurrent requests could reorder the content.
+    """
+    client = _client()
+    response = None
+    for i in range(0, len(blocks), _MAX_CHILDREN):
+        response = client.patch(
+            f"{NOTION_API_URL}/blocks/{page_uuid}/children",
+            headers=headers,
+            json={"children": blocks[i:i + _MAX_CHILDREN]},
+            timeout=30.0
+        )
+        if response.status_code != 200:
+            raise RuntimeError(f"Notion API error: {response.status_code} - {response.text}")
+    # Only the final chunk's response is returned, so only it is decoded
+    return response.json() if response is not None else {}
+
+
 def extract_page_id(url_or_id: str) -> str:
     """
     Extract and format page ID from a Notion URL or raw ID.
@@ -36,10 +75,14 @@ def extract_page_id(url_or_id: str) -> str:
     - Full URLs: https://www.notion.so/Page-Name-abc123...
     - Raw IDs with or without dashes
     """
+    # Already formatted (e.g. an ID returned by the API)
+    if len(url_or_id) == 36 and _DASHED_PAGE_ID_RE.fullmatch(url_or_id):
+        return url_or_id
+
     # If it's a URL, extract the ID from the end
     if "notion.so" in url_or_id:
         # Get the last segment after the last dash in the path
-        match = re.search(r"([a-f0-9]{32})$", url_or_id.replace("-", ""))
+        match = _URL_PAGE_ID_RE.search(url_or_id.replace("-", ""))
         if match:
             raw_id = match.group(1)
         else:
@@ -82,7 +125,7 @@ def create_page(
         "Notion-Version": NOTION_VERSION,
         "Content-Type": "application/json",
     }
-    httpx = _httpx()
+    client = _client()
 
     # Build the page payload
     payload = {
@@ -95,9 +138,9 @@ def create_page(
     # Add first chunk of content blocks if provided (Notion limit: 100 per request)
     blocks = _text_to_blocks(content) if content else []
     if blocks:
-        payload["children"] = blocks[:100]
+        payload["children"] = blocks[:_MAX_CHILDREN]
 
-    response = httpx.post(
+    response = client.post(
         f"{NOTION_API_URL}/pages",
         headers=headers,
         json=payload,
@@ -110,18 +153,8 @@ def create_page(
     result = response.json()
 
     # Append remaining blocks in chunks of 100
-    if len(blocks) > 100:
-        page_uuid = result["id"]
-        for i in range(100, len(blocks), 100):
-            chunk = blocks[i:i + 100]
-            chunk_response = httpx.patch(
-                f"{NOTION_API_URL}/blocks/{page_uuid}/children",
-                headers=headers,
-                json={"children": chunk},
-                timeout=30.0
-            )
-            if chunk_response.status_code != 200:
-                raise RuntimeError(f"Notion API error: {chunk_response.status_code} - {chunk_response.text}")
+    if len(blocks) > _MAX_CHILDREN:
+        _append_children(result["id"], blocks[_MAX_CHILDREN:], headers)
 
     return result
 
@@ -143,7 +176,7 @@ def get_blocks(
         "Authorization": f"Bearer {token}",
         "Notion-Version": NOTION_VERSION,
     }
-    httpx = _httpx()
+    client = _client()
 
     blocks = []
     cursor = None
@@ -152,7 +185,7 @@ def get_blocks(
         if cursor:
             params["start_cursor"] = cursor
 
-        response = httpx.get(
+        response = client.get(
             f"{NOTION_API_URL}/blocks/{page_uuid}/children",
             headers=headers,
             params=params,
@@ -185,7 +218,6 @@ def append_raw_blocks(
         "Notion-Version": NOTION_VERSION,
         "Content-Type": "application/json",
     }
-    httpx = _httpx()
 
     # Strip server-only fields Notion rejects on write
     _STRIP = {"id", "created_time", "last_edited_time", "created_by",
@@ -195,16 +227,7 @@ def append_raw_blocks(
     def _clean(block: dict) -> dict:
         return {k: v for k, v in block.items() if k not in _STRIP}
 
-    for i in range(0, len(blocks), 100):
-        chunk = [_clean(b) for b in blocks[i:i + 100]]
-        response = httpx.patch(
-            f"{NOTION_API_URL}/blocks/{page_uuid}/children",
-            headers=headers,
-            json={"children": chunk},
-            timeout=30.0
-        )
-        if response.status_code != 200:
-            raise RuntimeError(f"Notion API error: {response.status_code} - {response.text}")
+    _append_children(page_uuid, [_clean(b) for b in blocks], headers)
 
 
 def delete_blocks(
@@ -213,13 +236,13 @@ def delete_blocks(
 ) -> None:
     """Delete a list of blocks by ID."""
     token = token or get_token()
-    httpx = _httpx()
+    client = _client()
     headers = {
         "Authorization": f"Bearer {token}",
         "Notion-Version": NOTION_VERSION,
     }
     for block_id in block_ids:
-        response = httpx.delete(
+        response = client.delete(
             f"{NOTION_API_URL}/blocks/{block_id}",
             headers=headers,
             timeout=30.0
@@ -252,24 +275,8 @@ def append_blocks(
         "Notion-Version": NOTION_VERSION,
         "Content-Type": "application/json",
     }
-    httpx = _httpx()
 
-    blocks = _text_to_blocks(content)
-    result = None
-
-    for i in range(0, len(blocks), 100):
-        chunk = blocks[i:i + 100]
-        response = httpx.patch(
-            f"{NOTION_API_URL}/blocks/{page_uuid}/children",
-            headers=headers,
-            json={"children": chunk},
-            timeout=30.0
-        )
-        if response.status_code != 200:
-            raise RuntimeError(f"Notion API error: {response.status_code} - {response.text}")
-        result = response.json()
-
-    return result or {}
+    return _append_children(page_uuid, _text_to_blocks(content), headers)
 
 
 def _rich_text(text: str) -> list:
@@ -282,6 +289,40 @@ def _rich_text(text: str) -> list:
     ]
 
 
+# Line prefix -> block kind.  Checkboxes come before bullets, since
+# "- [ ] " also starts with "- ".
+_BLOCK_RE = re.compile(
+    r"(?P<divider>---$)"
+    r"|(?P<heading_3>### )"
+    r"|(?P<heading_2>## )"
+    r"|(?P<heading_1># )"
+    r"|(?P<done>- \[[xX]\] )"
+    r"|(?P<todo>- \[ \] )"
+    r"|(?P<bullet>[-*] )"
+)
+
+
+def _text_block(block_type: str, text: str) -> dict:
+    """Build a block whose only payload is rich text (headings, bullets)."""
+    return {"type": block_type, block_type: {"rich_text": _rich_text(text)}}
+
+
+def _todo_block(text: str, checked: bool) -> dict:
+    """Build a checkbox block, ticked when *checked*."""
+    return {"type": "to_do", "to_do": {"rich_text": _rich_text(text), "checked": checked}}
+
+
+_BLOCK_BUILDERS = {
+    "divider": lambda _text: {"type": "divider", "divider": {}},
+    "heading_3": functools.partial(_text_block, "heading_3"),
+    "heading_2": functools.partial(_text_block, "heading_2"),
+    "heading_1": functools.partial(_text_block, "heading_1"),
+    "done": functools.partial(_todo_block, checked=True),
+    "todo": functools.partial(_todo_block, checked=False),
+    "bullet": functools.partial(_text_block, "bulleted_list_item"),
+}
+
+
 def _text_to_blocks(content: str) -> list:
     """
     Convert text content to Notion block objects.
@@ -289,9 +330,13 @@ def _text_to_blocks(content: str) -> list:
     Handles:
     - Paragraphs (double newline separated)
     - Headers (lines starting with #, ##, ###)
+    - Checkboxes (lines starting with - [ ] or - [x])
     - Bullet points (lines starting with - or *)
     - Dividers (lines that are just ---)
     """
+    if not content or content.isspace():
+        return []
+
     blocks = []
     lines = content.split("\n")
     current_paragraph: list = []
@@ -300,10 +345,7 @@ def _text_to_blocks(content: str) -> list:
         if current_paragraph:
             text = " ".join(current_paragraph).strip()
             if text:
-                blocks.append({
-                    "type": "paragraph",
-                    "paragraph": {"rich_text": _rich_text(text)}
-                })
+                blocks.append(_text_block("paragraph", text))
             current_paragraph.clear()
 
     for line in lines:
@@ -314,67 +356,11 @@ def _text_to_blocks(content: str) -> list:
             flush_paragraph()
             continue
 
-        # Divider
-        if stripped == "---":
-            flush_paragraph()
-            blocks.append({"type": "divider", "divider": {}})
-            continue
-
-        # Headers
-        if stripped.startswith("### "):
-            flush_paragraph()
-            blocks.append({
-                "type": "heading_3",
-                "heading_3": {"rich_text": _rich_text(stripped[4:])}
-            })
-            continue
-
-        if stripped.startswith("## "):
-            flush_paragraph()
-            blocks.append({
-                "type": "heading_2",
-                "heading_2": {"rich_text": _rich_text(stripped[3:])}
-            })
-            continue
-
-        if stripped.startswith("# "):
-            flush_paragraph()
-            blocks.append({
-                "type": "heading_1",
-                "heading_1": {"rich_text": _rich_text(stripped[2:])}
-            })
-            continue
-
-        # Bullet points
-        if stripped.startswith("- ") or stripped.startswith("* "):
-            flush_paragraph()
-            blocks.append({
-                "type": "bulleted_list_item",
-                "bulleted_list_item": {"rich_text": _rich_text(stripped[2:])}
-            })
-            continue
-
-        # Checkbox items
-        if stripped.startswith("- [ ] "):
-            flush_paragraph()
-            blocks.append({
-                "type": "to_do",
-                "to_do": {
-                    "rich_text": _rich_text(stripped[6:]),
-                    "checked": False
-                }
-            })
-            continue
-
-        if stripped.startswith("- [x] ") or stripped.startswith("- [X] "):
+        match = _BLOCK_RE.match(stripped)
+        if match:
             flush_paragraph()
-            blocks.append({
-                "type": "to_do",
-                "to_do": {
-                    "rich_text": _rich_text(stripped[6:]),
-                    "checked": True
-                }
-            })
+            build = _BLOCK_BUILDERS[match.lastgroup]
+            blocks.append(build(stripped[match.end():]))
             continue
 
         # Regular text - accumulate for paragraph
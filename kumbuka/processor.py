@@ -1,16 +1,17 @@
 """Claude processing functionality."""
 
+import functools
 import json
 import os
-import shutil
 import subprocess
 import sys
-from pathlib import Path
 
 from .config import PROMPTS_DIR, NOTES_DESTINATION, NOTION_URL, NOTION_MODE, USER_NAME
 from .filenames import sanitize_filename
-from .render import format_notes
+from .render import print_notes
+from .runtime import find_claude
 
+# Passed on the command line, so serialized without optional whitespace
 OUTPUT_SCHEMA = json.dumps({
     "type": "object",
     "properties": {
@@ -56,32 +57,13 @@ OUTPUT_SCHEMA = json.dumps({
         }
     },
     "required": ["title", "filename", "participants", "summary", "transcript"]
-})
-
-
-def find_claude() -> str | None:
-    """Find claude CLI in PATH or common locations."""
-    # Check PATH first
-    claude = shutil.which("claude")
-    if claude:
-        return claude
-
-    # Check common locations
-    locations = [
-        Path.home() / ".npm-global/bin/claude",
-        Path.home() / ".local/bin/claude",
-        Path("/usr/local/bin/claude"),
-    ]
-    for loc in locations:
-        if loc.exists():
-            return str(loc)
-
-    return None
+}, separators=(",", ":"))
 
 
+@functools.lru_cache(maxsize=8)
 def load_prompt(name: str = "meeting") -> str:
     """
-    Load a prompt template from the prompts directory.
+    Load a prompt template from the prompts directory (cached per name).
 
     Args:
         name: Prompt name (without .txt extension)
@@ -92,7 +74,7 @@ def load_prompt(name: str = "meeting") -> str:
     prompt_file = PROMPTS_DIR / f"{name}.txt"
     if not prompt_file.exists():
         raise FileNotFoundError(f"Prompt not found: {prompt_file}")
-    return prompt_file.read_text()
+    return prompt_file.read_text(encoding="utf-8")
 def _run_claude_structured(
     claude: str, prompt: str
 ) -> dict | None:
@@ -114,20 +96,27 @@ def _run_claude_structured(
         assert proc.stdout is not None
         for line in proc.stdout:
             line = line.strip()
-            if not line:
+            # Cheap substring check first: only assistant and result events
+            # are used, so skip decoding system/user/tool events.  Matches on
+            # the quoted value alone so it doesn't depend on JSON spacing.
+            if not line or ('"assistant"' not in line and '"result"' not in line):
                 continue
             try:
                 event = json.loads(line)
             except json.JSONDecodeError:
                 continue
 
-            # Print assistant text to terminal (progress updates)
+            # Print assistant text to terminal (progress updates), one
+            # write and flush per event rather than per text block
             if event.get("type") == "assistant":
                 message = event.get("message", {})
-                for block in message.get("content", []):
-                    if block.get("type") == "text":
-                        sys.stdout.write(block["text"])
-                        sys.stdout.flush()
+                text = "".join(
+                    block["text"] for block in message.get("content", [])
+                    if block.get("type") == "text"
+                )
+                if text:
+                    sys.stdout.write(text)
+                    sys.stdout.flush()
 
             # Capture structured output from result
             if event.get("type") == "result":
@@ -147,7 +136,8 @@ def process_with_claude(
     transcript: str,
     duration: str,
     timestamp: str,
-    prompt_name: str = "meeting"
+    prompt_name: str = "meeting",
+    template: str | None = None,
 ) -> dict | None:
     """
     Send transcript to Claude for processing.
@@ -157,6 +147,7 @@ def process_with_claude(
         duration: Recording duration string
         timestamp: Recording timestamp string
         prompt_name: Which prompt template to use
+        template: Preloaded prompt template (loaded from prompt_name if omitted)
 
     Returns:
         Structured output dict with title, filename, participants,
@@ -164,7 +155,8 @@ def process_with_claude(
     """
     print("\n🤖 Sending to Claude...")
 
-    template = load_prompt(prompt_name)
+    if template is None:
+        template = load_prompt(prompt_name)
 
     # MCP mode: append Notion instructions so Claude creates the page via MCP tools
     notion_instructions = ""
@@ -194,5 +186,6 @@ Also create a Notion subpage for this meeting:
     if not result:
         return None
 
-    print(f"\n{format_notes(result)}")
+    print()
+    print_notes(result)
     return result
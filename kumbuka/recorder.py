@@ -1,11 +1,14 @@
 """Audio recording functionality with resilient incremental saving."""
 
+import functools
 import io
+import os
 import signal
 import time
 import wave
 import threading
 from datetime import datetime
+from pathlib import Path
 
 try:
     import numpy as np
@@ -21,17 +24,89 @@ from .config import SAMPLE_RATE, CHANNELS, MAX_DURATION, OUTPUT_DIR, AUDIO_DEVIC
 from .audio_devices import resolve_recording_config
 
 
+# Incremental save settings
+SAVE_INTERVAL_SECS = 10  # Save to disk every 10 seconds
+
+
+class _AudioBuffer:
+    """Mono int16 buffer that a stream callback copies blocks into.
+
+    Audio lives in fixed-size segments: each callback is a slice copy into
+    the current segment, and a full segment is followed by a new one, so
+    growing never copies audio already captured. Readers only take the
+    segment references under the lock and join them after releasing it,
+    so the callback never waits behind a copy of the whole recording.
+    """
+
+    def __init__(self, segment_frames: int = SAMPLE_RATE * SAVE_INTERVAL_SECS * 2):
+        self._segment_frames = segment_frames
+        self._segments = []
+        self._fill = 0  # frames used in the last segment
+        self._frames = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._frames
+
+    def append(self, block) -> None:
+        """Copy a (frames, 1) int16 block onto the end of the buffer."""
+        with self._lock:
+            copied = 0
+            while copied < len(block):
+                if not self._segments or self._fill == self._segment_frames:
+                    self._segments.append(
+                        np.empty((self._segment_frames, 1), dtype=np.int16)
+                    )
+                    self._fill = 0
+                take = min(len(block) - copied, self._segment_frames - self._fill)
+                self._segments[-1][self._fill:self._fill + take] = block[copied:copied + take]
+                self._fill += take
+                copied += take
+            self._frames += len(block)
+
+    @staticmethod
+    def _join(segments: list, fill: int):
+        """Concatenate segments, using only the filled part of the last."""
+        if not segments:
+            return np.empty((0, 1), dtype=np.int16)
+        return np.concatenate(segments[:-1] + [segments[-1][:fill]])
+
+    def snapshot(self):
+        """Return a copy of everything buffered so far."""
+        with self._lock:
+            segments, fill = list(self._segments), self._fill
+        # Frames before `fill` are never rewritten, so they can be copied
+        # while the callback keeps appending
+        return self._join(segments, fill)
+
+    def drain(self):
+        """Return a copy of the buffered audio and empty the buffer."""
+        with self._lock:
+            segments, fill = self._segments, self._fill
+            self._segments = []
+            self._fill = 0
+            self._frames = 0
+        return self._join(segments, fill)
+
+    def clear(self) -> None:
+        """Drop all audio and release the storage."""
+        with self._lock:
+            self._segments = []
+            self._fill = 0
+            self._frames = 0
+
+
 # Module state — primary stream (mic or single device)
 _stop_event = threading.Event()
-_chunks = []
-_chunks_lock = threading.Lock()
+_primary = _AudioBuffer()
 
 # Module state — secondary stream (system audio via BlackHole)
-_chunks_secondary = []
-_chunks_secondary_lock = threading.Lock()
+_secondary = _AudioBuffer()
 
-# Incremental save settings
-SAVE_INTERVAL_SECS = 10  # Save to disk every 10 seconds
+# Single-stream mode: the open .partial.wav (file, wave writer) that new
+# audio is appended to, and the number of frames written to it
+_partial = None
+_partial_frames = 0
 
 
 def _require_audio_deps():
@@ -47,29 +122,41 @@ def _require_audio_deps():
         sd = _sd
 
 
-def _tone(freq=880, dur=0.15, vol=0.3):
-    """Play a simple tone."""
-    _require_audio_deps()
-    t = np.linspace(0, dur, int(SAMPLE_RATE * dur), False)
-    w = np.sin(freq * 2 * np.pi * t) * vol
-    env = np.ones_like(w)
+@functools.lru_cache(maxsize=None)
+def _tone_samples(tones: tuple[tuple[int, float], ...], vol: float = 0.3):
+    """Build a sequence of (freq, dur) tones as int16 samples (cached)."""
     fade = int(SAMPLE_RATE * 0.01)
-    env[:fade] = np.linspace(0, 1, fade)
-    env[-fade:] = np.linspace(1, 0, fade)
-    sd.play((w * env * 32767).astype(np.int16), SAMPLE_RATE)
-    sd.wait()
+    parts = []
+    for freq, dur in tones:
+        t = np.linspace(0, dur, int(SAMPLE_RATE * dur), False)
+        w = np.sin(freq * 2 * np.pi * t) * vol
+        env = np.ones_like(w)
+        env[:fade] = np.linspace(0, 1, fade)
+        env[-fade:] = np.linspace(1, 0, fade)
+        parts.append((w * env * 32767).astype(np.int16))
+    return np.concatenate(parts)
+
+
+_START_TONES = ((660, 0.1), (880, 0.15))
+_STOP_TONES = ((880, 0.1), (660, 0.15))
+
+
+def _play(tones, wait: bool = True):
+    """Play a tone sequence, by default waiting for it to finish."""
+    _require_audio_deps()
+    sd.play(_tone_samples(tones), SAMPLE_RATE)
+    if wait:
+        sd.wait()
 
 
-def play_start_tone():
+def play_start_tone(wait: bool = True):
     """Play ascending tones to indicate recording started."""
-    _tone(660, 0.1)
-    _tone(880, 0.15)
+    _play(_START_TONES, wait=wait)
 
 
 def play_stop_tone():
     """Play descending tones to indicate recording stopped."""
-    _tone(880, 0.1)
-    _tone(660, 0.15)
+    _play(_STOP_TONES)
 
 
 def _on_signal(_sig, _frame):
@@ -139,17 +226,15 @@ def _mix_streams(primary_chunks: list, secondary_chunks: list) -> list:
 
 def _get_mixed_chunks() -> list:
     """Get current audio chunks, mixing dual streams if active."""
-    with _chunks_lock:
-        primary = _chunks.copy()
-    with _chunks_secondary_lock:
-        secondary = _chunks_secondary.copy()
+    primary = _primary.snapshot()
+    secondary = _secondary.snapshot()
 
-    if not secondary:
+    if not len(secondary):
         # Single-stream mode or no secondary audio yet
-        return primary
+        return [primary] if len(primary) else []
 
-    # Downmix each set to mono first, then mix together
-    return _mix_streams(primary, secondary)
+    # Both streams are already mono; mix them together
+    return _mix_streams([primary], [secondary])
 
 
 def _chunks_to_wav(chunks: list) -> bytes:
@@ -166,23 +251,92 @@ def _chunks_to_wav(chunks: list) -> bytes:
         w.setframerate(SAMPLE_RATE)
         w.writeframes(audio.tobytes())
     # pylint: enable=no-member
-    buf.seek(0)
-    return buf.read()
+    return buf.getvalue()
+
+
+def _wav_duration(path) -> float:
+    """Return a WAV file's duration in seconds, read from its header."""
+    try:
+        # pylint: disable=no-member
+        with wave.open(str(path), "rb") as w:
+            return w.getnframes() / w.getframerate()
+    except (wave.Error, EOFError):
+        # Truncated header (killed mid-write): estimate from the file size
+        return path.stat().st_size / (SAMPLE_RATE * 2 * CHANNELS)
+
+
+def _close_partial():
+    """Close the single-stream partial WAV, if one is open."""
+    global _partial  # pylint: disable=global-statement
+    if _partial is not None:
+        fh, writer = _partial
+        _partial = None
+        try:
+            writer.close()
+        finally:
+            fh.close()
+
+
+def _append_incremental(session: str, final: bool = False) -> float:
+    """Append audio captured since the last save to the partial WAV.
+
+    Used in single-stream mode, where nothing needs mixing: each save writes
+    only the new frames and the wave writer patches the header sizes, so the
+    .partial.wav stays a valid WAV without rewriting the whole recording.
+    On final save the file is closed and renamed.
+
+    Returns:
+        Duration of the audio written so far, in seconds
+    """
+    global _partial, _partial_frames  # pylint: disable=global-statement
 
+    audio = _primary.drain()
 
-def _save_incremental(session: str, final: bool = False):
+    partial_path = OUTPUT_DIR / f"{session}.partial.wav"
+    if len(audio):
+        if _partial is None:
+            fh = open(partial_path, "wb")  # pylint: disable=consider-using-with
+            # pylint: disable=no-member
+            writer = wave.open(fh, "wb")
+            writer.setnchannels(CHANNELS)
+            writer.setsampwidth(2)
+            writer.setframerate(SAMPLE_RATE)
+            # pylint: enable=no-member
+            _partial = (fh, writer)
+            _partial_frames = 0
+        fh, writer = _partial
+        writer.writeframes(audio.tobytes())
+        fh.flush()
+        _partial_frames += len(audio)
+
+    dur = _partial_frames / SAMPLE_RATE
+    if final and _partial is not None:
+        _close_partial()
+        final_path = OUTPUT_DIR / f"{session}.wav"
+        partial_path.rename(final_path)
+        m, s = divmod(int(dur), 60)
+        print(f"💾 Saved: {final_path} ({m}m {s}s)")
+
+    return dur
+
+
+def _save_incremental(session: str, final: bool = False) -> float:
     """Save current audio to disk incrementally.
 
     Uses a .partial extension while recording, renamed on final save.
-    In dual-stream mode, mixes both streams before saving.
+    Used in dual-stream mode: both streams are normalized over the whole
+    recording before mixing, so the full mix is rewritten on each save.
+
+    Returns:
+        Duration of the audio written, in seconds (0 if there was no audio)
     """
     chunks_copy = _get_mixed_chunks()
     if not chunks_copy:
-        return
+        return 0.0
 
     wav_bytes = _chunks_to_wav(chunks_copy)
     if not wav_bytes:
-        return
+        return 0.0
 
     partial_path = OUTPUT_DIR / f"{session}.partial.wav"
     final_path = OUTPUT_DIR / f"{session}.wav"
@@ -190,61 +344,65 @@ def _save_incremental(session: str, final: bool = False):
     # Write to partial file
     partial_path.write_bytes(wav_bytes)
 
+    dur = sum(len(c) for c in chunks_copy) / SAMPLE_RATE
     if final:
         # Rename to final
         partial_path.rename(final_path)
-        # Duration: bytes / (sample_rate * bytes_per_sample * channels)
-        dur = len(wav_bytes) / (SAMPLE_RATE * 2 * CHANNELS)
         m, s = divmod(int(dur), 60)
         print(f"💾 Saved: {final_path} ({m}m {s}s)")
 
+    return dur
 
-def recover_partial(session: str | None = None) -> tuple[bytes | None, str | None]:
+
+def recover_partial(session: str | None = None) -> tuple[Path | None, float]:
     """Recover audio from a partial recording.
 
     Args:
         session: Specific session ID to recover, or None to find latest partial
 
     Returns:
-        tuple: (wav_bytes, session_id) or (None, None) if no partial found
+        tuple: (wav_path, duration_secs) or (None, 0.0) if no partial found.
+        The session ID is wav_path.stem.
     """
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
     if session:
         partial_path = OUTPUT_DIR / f"{session}.partial.wav"
         if partial_path.exists():
-            wav_bytes = partial_path.read_bytes()
+            dur = _wav_duration(partial_path)
             # Rename to final
             final_path = OUTPUT_DIR / f"{session}.wav"
             partial_path.rename(final_path)
             print(f"🔄 Recovered: {final_path}")
-            return wav_bytes, session
-        return None, None
-
-    # Find most recent partial
-    partials = sorted(OUTPUT_DIR.glob("*.partial.wav"),
-                      key=lambda p: p.stat().st_mtime, reverse=True)
-    if not partials:
+            return final_path, dur
+        return None, 0.0
+
+    # Find most recent partial (DirEntry caches the stat result)
+    with os.scandir(OUTPUT_DIR) as entries:
+        latest = max(
+            (e for e in entries if e.name.endswith(".partial.wav") and e.is_file()),
+            key=lambda e: e.stat().st_mtime,
+            default=None,
+        )
+    if latest is None:
         print("ℹ️  No partial recordings found")
-        return None, None
+        return None, 0.0
 
-    partial_path = partials[0]
+    partial_path = Path(latest.path)
     session = partial_path.stem.replace(".partial", "")
-    wav_bytes = partial_path.read_bytes()
+    dur = _wav_duration(partial_path)
 
     # Rename to final
     final_path = OUTPUT_DIR / f"{session}.wav"
     partial_path.rename(final_path)
 
-    # Duration: bytes / (sample_rate * bytes_per_sample * channels)
-    dur = len(wav_bytes) / (SAMPLE_RATE * 2 * CHANNELS)
     m, s = divmod(int(dur), 60)
     print(f"🔄 Recovered: {final_path} ({m}m {s}s)")
 
-    return wav_bytes, session
+    return final_path, dur
 
 
-def record(duration_secs: int | None = None) -> tuple[bytes | None, str | None]:
+def record(duration_secs: int | None = None) -> tuple[Path | None, float]:
     """
     Record audio until Ctrl+C or max duration.
 
@@ -259,9 +417,10 @@ def record(duration_secs: int | None = None) -> tuple[bytes | None, str | None]:
                        Clamped to MAX_DURATION. Ctrl+C still stops early.
 
     Returns:
-        tuple: (wav_bytes, session_id) or (None, None) if no audio
+        tuple: (wav_path, recorded_secs) or (None, 0.0) if no audio.
+        The session ID is wav_path.stem.
     """
-    global _chunks, _chunks_secondary  # pylint: disable=global-statement
+    global _partial_frames  # pylint: disable=global-statement
     _require_audio_deps()
 
     # Resolve audio device configuration
@@ -269,13 +428,13 @@ def record(duration_secs: int | None = None) -> tuple[bytes | None, str | None]:
         rec_config = resolve_recording_config(AUDIO_DEVICE)
     except RuntimeError as e:
         print(f"❌ Audio device error: {e}")
-        return None, None
+        return None, 0.0
 
     _stop_event.clear()
-    with _chunks_lock:
-        _chunks = []
-    with _chunks_secondary_lock:
-        _chunks_secondary = []
+    _primary.clear()
+    _secondary.clear()
+    _close_partial()
+    _partial_frames = 0
 
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     session = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
@@ -283,45 +442,49 @@ def record(duration_secs: int | None = None) -> tuple[bytes | None, str | None]:
     # Set up signal handler
     old_handler = signal.signal(signal.SIGINT, _on_signal)
 
+    # Mono blocks are copied straight into the buffer; only
+    # multi-channel input needs an intermediate downmix array
     def callback_primary(indata, _frames, _time_info, _status):
         if not _stop_event.is_set():
-            mono = _to_mono(indata) if indata.shape[1] > 1 else indata.copy()
-            with _chunks_lock:
-                _chunks.append(mono)
+            _primary.append(_to_mono(indata) if indata.shape[1] > 1 else indata)
 
     def callback_secondary(indata, _frames, _time_info, _status):
         if not _stop_event.is_set():
-            mono = _to_mono(indata) if indata.shape[1] > 1 else indata.copy()
-            with _chunks_secondary_lock:
-                _chunks_secondary.append(mono)
+            _secondary.append(_to_mono(indata) if indata.shape[1] > 1 else indata)
 
     effective_max = min(duration_secs, MAX_DURATION) if duration_secs else MAX_DURATION
 
-    play_start_tone()
-    if duration_secs:
-        dm, ds = divmod(effective_max, 60)
-        print(f"\n🎙️  RECORDING STARTED ({dm}m {ds}s)")
-        print("   Press Ctrl+C to stop early")
-    else:
-        print("\n🎙️  RECORDING STARTED")
-        print("   Press Ctrl+C to stop")
-    print(f"   Audio: {rec_config.description}\n")
-
-    last_save_time = time.time()
+    last_save_time = time.monotonic()
+    # Dual-stream audio has to be re-mixed; a single stream is just appended
+    save = _save_incremental if rec_config.mode == "dual" else _append_incremental
 
     def _recording_loop(effective_max, duration_secs, session):
         """Main recording loop shared by single and dual-stream modes."""
         nonlocal last_save_time
-        start = datetime.now()
-        while not _stop_event.is_set():
-            time.sleep(0.1)
 
-            elapsed = (datetime.now() - start).seconds
+        # The input stream is already open: play the start tone without
+        # blocking so the first words aren't lost while it sounds
+        play_start_tone(wait=False)
+        if duration_secs:
+            dm, ds = divmod(effective_max, 60)
+            print(f"\n🎙️  RECORDING STARTED ({dm}m {ds}s)")
+            print("   Press Ctrl+C to stop early")
+        else:
+            print("\n🎙️  RECORDING STARTED")
+            print("   Press Ctrl+C to stop")
+        print(f"   Audio: {rec_config.description}\n")
+
+        # One monotonic clock for elapsed time, saves and the blinking dot;
+        # waiting on the event (not sleeping) lets Ctrl+C stop immediately
+        start = time.monotonic()
+        while not _stop_event.wait(0.1):
+            now = time.monotonic()
+            elapsed = int(now - start)
 
             # Incremental save every SAVE_INTERVAL_SECS
-            if time.time() - last_save_time >= SAVE_INTERVAL_SECS:
-                _save_incremental(session)
-                last_save_time = time.time()
+            if now - last_save_time >= SAVE_INTERVAL_SECS:
+                save(session)
+                last_save_time = time.monotonic()
 
             if elapsed >= effective_max:
                 if duration_secs:
@@ -333,11 +496,11 @@ def record(duration_secs: int | None = None) -> tuple[bytes | None, str | None]:
             if duration_secs:
                 remaining = max(0, effective_max - elapsed)
                 rm, rs = divmod(remaining, 60)
-                dot = "🔴" if int(time.time() * 2) % 2 == 0 else "⚫"
+                dot = "🔴" if int(now * 2) % 2 == 0 else "⚫"
                 print(f"\r   {dot} Recording: {rm:02d}:{rs:02d} remaining", end="", flush=True)
             else:
                 m, s = divmod(elapsed, 60)
-                dot = "🔴" if int(time.time() * 2) % 2 == 0 else "⚫"
+                dot = "🔴" if int(now * 2) % 2 == 0 else "⚫"
                 print(f"\r   {dot} {m:02d}:{s:02d}", end="", flush=True)
 
     try:
@@ -374,21 +537,14 @@ def record(duration_secs: int | None = None) -> tuple[bytes | None, str | None]:
     play_stop_tone()
     print("\r   🛑 Recording stopped             ")
 
-    # Get final mixed audio
-    chunks_copy = _get_mixed_chunks()
+    # Save final file (removes .partial); the WAV is not kept in memory
+    recorded_secs = save(session, final=True)
 
-    if not chunks_copy:
+    if not recorded_secs:
         print("❌ No audio recorded")
         # Clean up any partial file
-        partial = OUTPUT_DIR / f"{session}.partial.wav"
-        if partial.exists():
-            partial.unlink()
-        return None, None
-
-    # Final save
-    wav = _chunks_to_wav(chunks_copy)
-
-    # Save final file (removes .partial)
-    _save_incremental(session, final=True)
+        _close_partial()
+        (OUTPUT_DIR / f"{session}.partial.wav").unlink(missing_ok=True)
+        return None, 0.0
 
-    return wav, session
+    return OUTPUT_DIR / f"{session}.wav", recorded_secs
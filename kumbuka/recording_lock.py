@@ -39,9 +39,6 @@ def _is_pid_alive(pid: int) -> bool:
 
 def get_active_recording() -> RecordingInfo | None:
     """Return info about the currently-active recording, or ``None``."""
-    if not LOCK_FILE.exists():
-        return None
-
     try:
         data = json.loads(LOCK_FILE.read_text(encoding="utf-8"))
         pid = data["pid"]
@@ -56,6 +53,8 @@ def get_active_recording() -> RecordingInfo | None:
             meeting=data.get("meeting", ""),
             started_at=data.get("started_at", ""),
         )
+    except FileNotFoundError:
+        return None
     except (json.JSONDecodeError, KeyError):
         # Corrupted content but file owned by unknown process — leave it
         # for stale-PID cleanup on the next call rather than deleting
@@ -100,8 +99,6 @@ def acquire(mode: str, meeting: str = "") -> RecordingInfo | None:
 def release():
     """Release the recording lock if held by this process."""
     try:
-        if not LOCK_FILE.exists():
-            return
         data = json.loads(LOCK_FILE.read_text(encoding="utf-8"))
         if data.get("pid") == os.getpid():
             LOCK_FILE.unlink(missing_ok=True)
@@ -1,31 +1,45 @@
 """Shared rendering helpers for meeting notes."""
 
+import sys
+from typing import Iterator, TextIO
 
-def format_notes(result: dict) -> str:
-    """Format structured output as readable markdown."""
-    sections = []
 
+def _iter_sections(result: dict) -> Iterator[str]:
+    """Yield the markdown sections of structured output, in order."""
     title = result.get("title", "Untitled Meeting")
-    sections.append(f"# {title}")
+    yield f"# {title}"
 
     participants = result.get("participants", [])
     if participants:
-        sections.append("## Participants")
-        sections.append("\n".join(f"- {p}" for p in participants))
+        yield "## Participants"
+        yield "\n".join(f"- {p}" for p in participants)
 
     summary = result.get("summary", "")
     if summary:
-        sections.append("## Summary")
-        sections.append(summary)
+        yield "## Summary"
+        yield summary
 
     feedback = result.get("feedback", "")
     if feedback:
-        sections.append("## Communication Feedback")
-        sections.append(feedback)
+        yield "## Communication Feedback"
+        yield feedback
 
     transcript = result.get("transcript", "")
     if transcript:
-        sections.append("## Transcript")
-        sections.append(transcript)
+        yield "## Transcript"
+        yield transcript
+
+
+def format_notes(result: dict) -> str:
+    """Format structured output as readable markdown."""
+    return "\n\n".join(_iter_sections(result))
+
 
-    return "\n\n".join(sections)
+def print_notes(result: dict, out: TextIO | None = None) -> None:
+    """Write the formatted notes section by section, without building one string."""
+    out = out or sys.stdout
+    for i, section in enumerate(_iter_sections(result)):
+        if i:
+            out.write("\n\n")
+        out.write(section)
+    out.write("\n")
@@ -1,15 +1,18 @@
 """Shared runtime helpers for executable discovery."""
 
+import functools
 import shutil
 import sys
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=1)
 def find_python() -> str:
     """Find python that has kumbuka installed.
 
     Checks uv tool python first, then falls back to system python.
-    Uses absolute paths for LaunchAgent compatibility.
+    Uses absolute paths for LaunchAgent compatibility. The result is
+    cached for the life of the process.
     """
     uv_python = Path.home() / ".local/share/uv/tools/kumbuka/bin/python"
     if uv_python.exists():
@@ -21,3 +24,27 @@ def find_python() -> str:
 
     python = shutil.which("python3") or shutil.which("python")
     return python or "/usr/bin/python3"
+
+
+@functools.lru_cache(maxsize=1)
+def find_claude() -> str | None:
+    """Find claude CLI in PATH or common locations.
+
+    The result is cached for the life of the process.
+    """
+    # Check PATH first
+    claude = shutil.which("claude")
+    if claude:
+        return claude
+
+    # Check common locations
+    locations = [
+        Path.home() / ".npm-global/bin/claude",
+        Path.home() / ".local/bin/claude",
+        Path("/usr/local/bin/claude"),
+    ]
+    for loc in locations:
+        if loc.exists():
+            return str(loc)
+
+    return None
@@ -1,39 +1,73 @@
 """FluidAudio transcription functionality."""
 
+import os
 import subprocess
+import threading
 from pathlib import Path
 
 from .config import FLUIDAUDIO_BIN, FLUIDAUDIO_REPO
 
+__all__ = ["build_in_background", "check_fluidaudio", "transcribe"]
 
-def _ensure_fluidaudio() -> bool:
+# Serializes builds between the background warm-up and transcribe()
+_build_lock = threading.Lock()
+
+
+def _ensure_fluidaudio(quiet: bool = False) -> bool:
     """
     Ensure FluidAudio binary exists, building it if necessary.
+
+    With quiet=True nothing is printed and build output is discarded, so
+    the build can run in the background while recording.
+    """
+    with _build_lock:
+        if FLUIDAUDIO_BIN.exists():
+            return True
+
+        repo_path = Path(FLUIDAUDIO_REPO)
+        if not repo_path.exists():
+            if not quiet:
+                print(f"❌ FluidAudio repo not found at {repo_path}")
+                print("   Clone it: git clone https://github.com/FluidInference/FluidAudio.git ~/FluidAudio")
+            return False
+
+        if not quiet:
+            print("🔨 Building FluidAudio (this may take a minute)...")
+        try:
+            # Quiet builds discard their output, so don't buffer it
+            output = subprocess.DEVNULL if quiet else None
+            subprocess.run(
+                ["swift", "build", "-c", "release"],
+                cwd=repo_path,
+                check=True,
+                stdout=output,
+                stderr=output
+            )
+            return True
+        except subprocess.CalledProcessError as e:
+            if not quiet:
+                print(f"❌ Failed to build FluidAudio: {e}")
+            return False
+        except FileNotFoundError:
+            if not quiet:
+                print("❌ Swift toolchain not found. Install Xcode or Swift.")
+            return False
+
+
+def build_in_background() -> threading.Thread | None:
+    """Start building FluidAudio on a daemon thread if the binary is missing.
+
+    Called when recording starts so the first-run build overlaps with the
+    meeting instead of delaying transcription. transcribe() waits for an
+    in-progress build and retries with full output if it failed.
     """
     if FLUIDAUDIO_BIN.exists():
-        return True
-
-    repo_path = Path(FLUIDAUDIO_REPO)
-    if not repo_path.exists():
-        print(f"❌ FluidAudio repo not found at {repo_path}")
-        print("   Clone it: git clone https://github.com/FluidInference/FluidAudio.git ~/FluidAudio")
-        return False
-
-    print("🔨 Building FluidAudio (this may take a minute)...")
-    try:
-        subprocess.run(
-            ["swift", "build", "-c", "release"],
-            cwd=repo_path,
-            check=True,
-            capture_output=False
-        )
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Failed to build FluidAudio: {e}")
-        return False
-    except FileNotFoundError:
-        print("❌ Swift toolchain not found. Install Xcode or Swift.")
-        return False
+        return None
+    thread = threading.Thread(
+        target=_ensure_fluidaudio, kwargs={"quiet": True}, daemon=True
+    )
+    thread.start()
+    return thread
 
 
 def transcribe(wav_path: Path) -> str | None:
@@ -51,6 +85,8 @@ def transcribe(wav_path: Path) -> str | None:
     if not _ensure_fluidaudio():
         return None
 
+    txt_path = wav_path.with_suffix(".txt")
+    tmp_path = txt_path.with_name(txt_path.name + ".tmp")
     try:
         # Run FluidAudio CLI
         # Usage: fluidaudio transcribe <file>
@@ -60,15 +96,16 @@ def transcribe(wav_path: Path) -> str | None:
             text=True,
             check=True
         )
-        
+
         text = result.stdout.strip()
         if text:
-            # Save transcript next to audio for reference
-            txt_path = wav_path.with_suffix(".txt")
-            txt_path.write_text(text)
+            # Save transcript next to audio for reference, swapped in whole
+            # so an interrupted write keeps any earlier transcript
+            tmp_path.write_text(text, encoding="utf-8")
+            os.replace(tmp_path, txt_path)
             print(f"💾 Saved: {txt_path} ({len(text)} chars)")
             return text
-        
+
         print("⚠️  No text transcribed")
         return None
 
@@ -78,18 +115,33 @@ def transcribe(wav_path: Path) -> str | None:
     except Exception as e:
         print(f"❌ Transcription error: {e}")
         return None
+    finally:
+        # Only left behind if the write or rename failed
+        tmp_path.unlink(missing_ok=True)
 
 
 def check_fluidaudio() -> bool:
-    """Check if FluidAudio requirements are met."""
-    # Check Swift
-    try:
-        subprocess.run(["swift", "--version"], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+    """Check if FluidAudio requirements are met.
+
+    Cheapest checks first: an existing binary needs no toolchain, and a
+    missing repo fails without spawning swift.
+    """
+    if FLUIDAUDIO_BIN.exists():
+        return True
 
     # Check Repo
     if not Path(FLUIDAUDIO_REPO).exists():
         return False
 
+    # Check Swift (needed to build the binary)
+    try:
+        subprocess.run(
+            ["swift", "--version"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True
+        )
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return False
+
     return True
\ No newline at end of file
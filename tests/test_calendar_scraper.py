@@ -1,6 +1,7 @@
 """Tests for calendar_scraper module -- aria-label parsing."""
 
 import pytest
+from unittest.mock import MagicMock
 from datetime import datetime
 
 from kumbuka.calendar_scraper import (
@@ -193,3 +194,223 @@ class TestParseTime:
         result = _parse_time("2 PM", self._ref())
         assert result.hour == 14
         assert result.minute == 0
+
+    def test_compact_form(self):
+        result = _parse_time("11:30am", self._ref())
+        assert result.hour == 11
+        assert result.minute == 30
+
+    def test_rejects_invalid_time(self):
+        with pytest.raises(ValueError):
+            _parse_time("13:00 PM", self._ref())
+
+
+class TestChromeIsRunning:
+    """Test Chrome process detection."""
+
+    def test_uses_running_applications_when_available(self, monkeypatch):
+        from kumbuka import calendar_scraper
+
+        class FakeRunningApplication:
+            @staticmethod
+            def runningApplicationsWithBundleIdentifier_(bundle_id):
+                assert bundle_id == calendar_scraper.CHROME_BUNDLE_ID
+                return ["chrome"]
+
+        def fail(_script):
+            raise AssertionError("osascript should not be used")
+
+        run_loop = MagicMock()
+        fake_run_loop = MagicMock()
+        fake_run_loop.currentRunLoop.return_value = run_loop
+        monkeypatch.setattr(calendar_scraper, "NSRunningApplication", FakeRunningApplication)
+        monkeypatch.setattr(calendar_scraper, "NSRunLoop", fake_run_loop, raising=False)
+        monkeypatch.setattr(calendar_scraper, "NSDate", MagicMock(), raising=False)
+        monkeypatch.setattr(calendar_scraper, "_run_applescript", fail)
+        assert calendar_scraper._chrome_is_running() is True
+        # The run loop is turned so the application list is current
+        run_loop.runUntilDate_.assert_called_once()
+
+    def test_falls_back_to_osascript(self, monkeypatch):
+        from kumbuka import calendar_scraper
+
+        monkeypatch.setattr(calendar_scraper, "NSRunningApplication", None)
+        monkeypatch.setattr(calendar_scraper, "_run_applescript", lambda _script: "false")
+        assert calendar_scraper._chrome_is_running() is False
+
+
+class TestWaitForTabLoad:
+    """Test polling for the calendar tab to finish loading."""
+
+    def test_backs_off_between_polls(self, monkeypatch):
+        from kumbuka import calendar_scraper
+
+        states = iter(["true", "true", "true", "true", "true", "false"])
+        sleeps = []
+        monkeypatch.setattr(calendar_scraper, "_run_applescript", lambda _script: next(states))
+        monkeypatch.setattr(calendar_scraper.time, "sleep", sleeps.append)
+
+        assert calendar_scraper._wait_for_tab_load(1, 1) is True
+        assert sleeps == pytest.approx([0.1, 0.2, 0.4, 0.8, 1])
+
+
+class TestFindCalendarTab:
+    """Test locating the calendar tab from the batched window/tab listing."""
+
+    def test_prefers_exact_calendar_url(self, monkeypatch):
+        from kumbuka import calendar_scraper
+
+        listing = (
+            "11\t1\thttps://example.com\n"
+            "11\t2\thttps://calendar.google.com/calendar/u/0/r/week\n"
+            f"22\t3\t{calendar_scraper.CALENDAR_URL}\n"
+        )
+        calls = []
+
+        def fake_run(script):
+            calls.append(script)
+            return listing
+
+        monkeypatch.setattr(calendar_scraper, "_run_applescript", fake_run)
+        assert calendar_scraper._find_calendar_tab() == (22, 3)
+        assert len(calls) == 1
+
+    def test_falls_back_to_any_calendar_tab(self, monkeypatch):
+        from kumbuka import calendar_scraper
+
+        listing = "11\t2\thttps://calendar.google.com/calendar/u/0/r/week\n"
+        monkeypatch.setattr(calendar_scraper, "_run_applescript", lambda _s: listing)
+        assert calendar_scraper._find_calendar_tab() == (11, 2)
+
+    def test_no_windows(self, monkeypatch):
+        from kumbuka import calendar_scraper
+
+        monkeypatch.setattr(calendar_scraper, "_run_applescript", lambda _s: "")
+        assert calendar_scraper._find_calendar_tab() is None
+
+
+class TestExtractEventsCache:
+    """Test the short-lived cache in front of the calendar scrape."""
+
+    def test_reuses_recent_scrape(self, monkeypatch):
+        from kumbuka import calendar_scraper
+
+        calls = []
+
+        def fake_scrape():
+            calls.append(1)
+            return []
+
+        monkeypatch.setattr(calendar_scraper, "_events_cache", None)
+        monkeypatch.setattr(calendar_scraper, "_scrape_events", fake_scrape)
+        calendar_scraper.get_upcoming_events(5)
+        calendar_scraper.get_current_meetings()
+        assert len(calls) == 1
+
+    def test_rescrapes_after_ttl(self, monkeypatch):
+        from kumbuka import calendar_scraper
+
+        calls = []
+
+        def fake_scrape():
+            calls.append(1)
+            return []
+
+        monkeypatch.setattr(calendar_scraper, "_events_cache", None)
+        monkeypatch.setattr(calendar_scraper, "_scrape_events", fake_scrape)
+        calendar_scraper._extract_events()
+        cached_at, events = calendar_scraper._events_cache
+        calendar_scraper._events_cache = (cached_at - calendar_scraper._EVENTS_TTL_S, events)
+        calendar_scraper._extract_events()
+        assert len(calls) == 2
+
+
+class TestParseRawLabels:
+    """Test memoized parsing of scraped labels."""
+
+    def test_repeated_labels_parsed_once(self, monkeypatch):
+        from kumbuka import calendar_scraper
+
+        calendar_scraper._parse_label_cached.cache_clear()
+        calls = []
+        real_parse = calendar_scraper._parse_aria_label
+
+        def counting_parse(label, *, datekey=None):
+            calls.append(label)
+            return real_parse(label, datekey=datekey)
+
+        monkeypatch.setattr(calendar_scraper, "_parse_aria_label", counting_parse)
+        label = "10:00 AM to 10:30 AM, Weekly Standup, March 20, 2026"
+
+        first = calendar_scraper._parse_raw_labels([label])
+        second = calendar_scraper._parse_raw_labels([label, "DATEKEY:20260320|||" + label])
+
+        assert first[0] == second[0]
+        assert len(second) == 2
+        # One parse for the plain label, one for the label with a datekey
+        assert len(calls) == 2
+        calendar_scraper._parse_label_cached.cache_clear()
+
+
+class TestGetMeetings:
+    """Test the combined upcoming/current partition."""
+
+    def test_partitions_single_scrape(self, monkeypatch):
+        from datetime import timedelta
+        from kumbuka import calendar_scraper
+
+        now = datetime.now().astimezone()
+
+        def make(title, start_offset, end_offset, all_day=False):
+            start = now + timedelta(minutes=start_offset)
+            end = now + timedelta(minutes=end_offset)
+            return CalendarEvent(
+                id=_generate_event_id(title, start, end, ()), title=title,
+                start=start, end=end, calendar_name="Google Calendar",
+                participants=(), is_all_day=all_day, raw_label=title,
+            )
+
+        in_progress = make("In Progress", -10, 20)
+        soon = make("Soon", 3, 30)
+        later = make("Later", 60, 90)
+        all_day = make("Holiday", -60, 600, all_day=True)
+
+        calls = []
+
+        def fake_extract():
+            calls.append(1)
+            return [later, soon, all_day, in_progress]
+
+        monkeypatch.setattr(calendar_scraper, "_extract_events", fake_extract)
+        upcoming, current = calendar_scraper.get_meetings(5)
+
+        assert upcoming == [soon]
+        assert current == [in_progress]
+        assert len(calls) == 1
+
+        # First timed event beyond the 5 minute window
+        assert calendar_scraper.get_next_event_start(5) == later.start
+
+
+class TestScrapeEvents:
+    """Test the confirmation double-scrape."""
+
+    def test_empty_first_scrape_skips_confirmation(self, monkeypatch):
+        from kumbuka import calendar_scraper
+
+        scrapes = []
+
+        def fake_scrape(window_id, tab_index):
+            scrapes.append((window_id, tab_index))
+            return []
+
+        def fail_sleep(_secs):
+            raise AssertionError("should not wait for a confirmation scrape")
+
+        monkeypatch.setattr(calendar_scraper, "ensure_kumbuka_calendar_tab", lambda: (1, 2))
+        monkeypatch.setattr(calendar_scraper, "_refresh_calendar_tab", lambda *_: None)
+        monkeypatch.setattr(calendar_scraper, "_scrape_aria_labels", fake_scrape)
+        monkeypatch.setattr(calendar_scraper.time, "sleep", fail_sleep)
+
+        assert calendar_scraper._scrape_events() == []
+        assert scrapes == [(1, 2)]
@@ -0,0 +1,205 @@
+"""Tests for the kumbuka CLI entry point."""
+
+import stat
+
+import pytest
+
+from kumbuka import __main__ as cli
+
+
+@pytest.fixture
+def env_file(tmp_path, monkeypatch):
+    path = tmp_path / "kumbuka.env"
+    monkeypatch.setattr(cli, "ENV_FILE", path)
+    monkeypatch.setattr(cli, "CONFIG_DIR", tmp_path)
+    cli._parse_env_file.cache_clear()
+    yield path
+    cli._parse_env_file.cache_clear()
+
+
+class TestEnvFile:
+    """Test reading and writing the config env file."""
+
+    def test_write_invalidates_cached_values(self, env_file):
+        cli._write_env_value("KUMBUKA_USER_NAME", "first")
+        assert cli._read_env_file()["KUMBUKA_USER_NAME"] == "first"
+
+        cli._write_env_value("KUMBUKA_USER_NAME", "second")
+        assert cli._read_env_file()["KUMBUKA_USER_NAME"] == "second"
+
+    def test_write_preserves_private_mode(self, env_file):
+        env_file.write_text('# settings\nNOTION_TOKEN="secret"\n')
+        env_file.chmod(0o600)
+
+        cli._write_env_value("KUMBUKA_USER_NAME", "Team")
+
+        assert stat.S_IMODE(env_file.stat().st_mode) == 0o600
+        assert env_file.read_text() == (
+            '# settings\nNOTION_TOKEN="secret"\nKUMBUKA_USER_NAME="Team"\n'
+        )
+
+    def test_new_file_is_private(self, env_file):
+        cli._write_env_value("NOTION_TOKEN", "secret")
+
+        assert stat.S_IMODE(env_file.stat().st_mode) == 0o600
+
+    def test_temp_file_never_looser_than_original(self, env_file, monkeypatch):
+        env_file.write_text('NOTION_TOKEN="secret"\n')
+        env_file.chmod(0o600)
+        modes = []
+        real_fdopen = cli.os.fdopen
+
+        def spy_fdopen(fd, *args, **kwargs):
+            modes.append(stat.S_IMODE(cli.os.fstat(fd).st_mode))
+            return real_fdopen(fd, *args, **kwargs)
+
+        monkeypatch.setattr(cli.os, "fdopen", spy_fdopen)
+        cli._write_env_value("KUMBUKA_USER_NAME", "Team")
+
+        # Permissions are already private when the file is opened for writing
+        assert modes == [0o600]
+
+    def test_failed_write_leaves_no_temp_file(self, env_file, monkeypatch):
+        env_file.write_text('KUMBUKA_USER_NAME="old"\n')
+
+        def fail(_src, _dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(cli.os, "replace", fail)
+        with pytest.raises(OSError):
+            cli._write_env_value("KUMBUKA_USER_NAME", "new")
+
+        assert not env_file.with_name("kumbuka.env.tmp").exists()
+        assert env_file.read_text() == 'KUMBUKA_USER_NAME="old"\n'
+
+
+class TestRenameSessionFiles:
+    """Test renaming session audio and transcript to the note filename."""
+
+    def test_dotted_session_name(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(cli, "OUTPUT_DIR", tmp_path)
+        (tmp_path / "standup.v2.wav").write_bytes(b"")
+        (tmp_path / "standup.v2.txt").write_text("hi")
+
+        cli._rename_session_files("standup.v2", "team-standup")
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "team-standup.txt", "team-standup.wav",
+        ]
+
+
+class TestMonitorEnable:
+    """Test that enabling the monitor only rewrites and reloads when needed."""
+
+    @pytest.fixture
+    def launchd(self, tmp_path, monkeypatch):
+        calls = []
+
+        def fake_run(cmd, **_kwargs):
+            calls.append(cmd)
+            return cli.subprocess.CompletedProcess(cmd, 0, stderr=b"")
+
+        monkeypatch.setattr(cli, "PLIST_DST", tmp_path / "LaunchAgents" / cli.PLIST_NAME)
+        monkeypatch.setattr(cli.subprocess, "run", fake_run)
+        return calls
+
+    def _enable(self, monkeypatch, *, loaded: bool):
+        monkeypatch.setattr(cli, "_monitor_loaded", lambda: loaded)
+        cli.monitor_enable()
+
+    def test_first_enable_writes_and_loads(self, launchd, monkeypatch):
+        self._enable(monkeypatch, loaded=False)
+
+        assert cli.PLIST_DST.exists()
+        assert launchd == [["launchctl", "load", str(cli.PLIST_DST)]]
+
+    def test_changed_and_loaded_reloads(self, launchd, monkeypatch):
+        cli.PLIST_DST.parent.mkdir()
+        cli.PLIST_DST.write_text("stale")
+
+        self._enable(monkeypatch, loaded=True)
+
+        assert cli.PLIST_DST.read_text() != "stale"
+        [cmd] = launchd
+        assert cmd[:2] == ["/bin/sh", "-c"]
+        assert "launchctl unload" in cmd[2] and "launchctl load" in cmd[2]
+
+    def test_unchanged_but_unloaded_loads(self, launchd, monkeypatch):
+        self._enable(monkeypatch, loaded=False)
+        launchd.clear()
+
+        self._enable(monkeypatch, loaded=False)
+
+        assert launchd == [["launchctl", "load", str(cli.PLIST_DST)]]
+
+    def test_unchanged_and_loaded_restarts_monitor(self, launchd, monkeypatch):
+        self._enable(monkeypatch, loaded=False)
+        mtime_ns = cli.PLIST_DST.stat().st_mtime_ns
+        launchd.clear()
+
+        self._enable(monkeypatch, loaded=True)
+
+        # No rewrite or reload, but the resident process is restarted so
+        # it picks up upgrades and env-file settings
+        assert cli.PLIST_DST.stat().st_mtime_ns == mtime_ns
+        assert launchd == [
+            ["launchctl", "kickstart", "-k", f"gui/{cli.os.getuid()}/{cli.MONITOR_LABEL}"]
+        ]
+
+
+class TestCommandLine:
+    """Test argument parsing and subcommand dispatch."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_parser(self):
+        cli._build_parser.cache_clear()
+        yield
+        cli._build_parser.cache_clear()
+
+    def _run(self, monkeypatch, *argv):
+        monkeypatch.setattr(cli.sys, "argv", ["kumbuka", *argv])
+        cli.main()
+
+    def test_dispatches_subcommand(self, monkeypatch):
+        called = []
+        monkeypatch.setitem(cli.MONITOR_COMMANDS, "status", lambda: called.append("status"))
+
+        self._run(monkeypatch, "monitor", "status")
+
+        assert called == ["status"]
+
+    def test_recover_session(self, monkeypatch):
+        recovered = []
+        monkeypatch.setattr(cli, "do_recover", recovered.append)
+
+        self._run(monkeypatch, "recover", "2025-12-17_14-30-00")
+
+        assert recovered == ["2025-12-17_14-30-00"]
+
+    def test_unknown_command_exits_2(self, monkeypatch):
+        with pytest.raises(SystemExit) as exc:
+            self._run(monkeypatch, "bogus")
+        assert exc.value.code == 2
+
+    def test_config_set_accepts_dash_value(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(cli, "config_set", lambda key, value: calls.append((key, value)))
+
+        self._run(monkeypatch, "config", "set", "user_name", "-x", "y")
+
+        assert calls == [("user_name", "-x y")]
+
+    def test_config_set_requires_value(self, monkeypatch):
+        with pytest.raises(SystemExit) as exc:
+            self._run(monkeypatch, "config", "set", "user_name")
+        assert exc.value.code == 2
+
+    def test_record_only_meeting(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(
+            cli, "do_record_only", lambda duration, meeting="": calls.append((duration, meeting))
+        )
+
+        self._run(monkeypatch, "record-only", "--duration", "60", "--meeting=-standup")
+
+        assert calls == [(60, "-standup")]
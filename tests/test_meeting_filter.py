@@ -8,11 +8,13 @@ from unittest.mock import patch, MagicMock
 import pytest
 
 from kumbuka.calendar_scraper import CalendarEvent, _generate_event_id
+from kumbuka.runtime import find_claude
 from kumbuka.meeting_filter import (
     _deterministic_classify,
     _classify_with_claude,
     _load_cache,
     _save_cache,
+    classify_events,
     should_record,
     CACHE_FILE,
 )
@@ -96,38 +98,58 @@ class TestDeterministicClassify:
 class TestClassifyWithClaude:
     """Test Claude CLI classification with mocked subprocess."""
 
-    @patch("kumbuka.meeting_filter.shutil.which", return_value="/usr/local/bin/claude")
+    @pytest.fixture(autouse=True)
+    def _reset_claude_path_cache(self):
+        find_claude.cache_clear()
+        yield
+        find_claude.cache_clear()
+
+    @patch("kumbuka.runtime.shutil.which", return_value="/usr/local/bin/claude")
     @patch("kumbuka.meeting_filter.subprocess.run")
     def test_record_response(self, mock_run, mock_which):
         mock_run.return_value = MagicMock(stdout="RECORD\n", returncode=0)
         event = _make_event("Unclear Meeting")
         assert _classify_with_claude(event) == "RECORD"
 
-    @patch("kumbuka.meeting_filter.shutil.which", return_value="/usr/local/bin/claude")
+    @patch("kumbuka.runtime.shutil.which", return_value="/usr/local/bin/claude")
     @patch("kumbuka.meeting_filter.subprocess.run")
     def test_skip_response(self, mock_run, mock_which):
         mock_run.return_value = MagicMock(stdout="SKIP\n", returncode=0)
         event = _make_event("Unclear Meeting")
         assert _classify_with_claude(event) == "SKIP"
 
-    @patch("kumbuka.meeting_filter.shutil.which", return_value=None)
-    def test_no_claude_defaults_to_record(self, mock_which):
+    @patch("kumbuka.meeting_filter.find_claude", return_value=None)
+    def test_no_claude_defaults_to_record(self, mock_find):
         event = _make_event("Unclear Meeting")
         assert _classify_with_claude(event) == "RECORD"
 
-    @patch("kumbuka.meeting_filter.shutil.which", return_value="/usr/local/bin/claude")
+    @patch("kumbuka.runtime.shutil.which", return_value="/usr/local/bin/claude")
     @patch("kumbuka.meeting_filter.subprocess.run", side_effect=Exception("timeout"))
     def test_exception_defaults_to_record(self, mock_run, mock_which):
         event = _make_event("Unclear Meeting")
         assert _classify_with_claude(event) == "RECORD"
 
-    @patch("kumbuka.meeting_filter.shutil.which", return_value="/usr/local/bin/claude")
+    @patch("kumbuka.runtime.shutil.which", return_value="/usr/local/bin/claude")
     @patch("kumbuka.meeting_filter.subprocess.run")
     def test_unclear_output_defaults_to_record(self, mock_run, mock_which):
         mock_run.return_value = MagicMock(stdout="I'm not sure what to do\n", returncode=0)
         event = _make_event("Unclear Meeting")
         assert _classify_with_claude(event) == "RECORD"
 
+    @patch("kumbuka.runtime.shutil.which", return_value="/usr/local/bin/claude")
+    @patch("kumbuka.meeting_filter.subprocess.run")
+    def test_claude_path_lookup_is_reused(self, mock_run, mock_which):
+        mock_run.return_value = MagicMock(stdout="RECORD\n", returncode=0)
+        _classify_with_claude(_make_event("Unclear Meeting"))
+        _classify_with_claude(_make_event("Another Meeting"))
+        mock_which.assert_called_once_with("claude")
+
+    @patch("kumbuka.meeting_filter.find_claude", return_value=None)
+    def test_missing_claude_is_not_cached(self, mock_find):
+        _classify_with_claude(_make_event("Unclear Meeting"))
+        _classify_with_claude(_make_event("Unclear Meeting"))
+        assert mock_find.cache_clear.call_count == 2
+
 
 class TestShouldRecord:
     """Test the main should_record function with cache behavior."""
@@ -168,6 +190,37 @@ class TestShouldRecord:
         assert should_record(event) is True
 
 
+class TestClassifyEvents:
+    """Test classifying several events in one pass."""
+
+    @patch("kumbuka.meeting_filter._load_cache", return_value={})
+    @patch("kumbuka.meeting_filter._save_cache")
+    @patch("kumbuka.meeting_filter._classify_with_claude")
+    def test_mixed_events_share_one_cache_write(self, mock_claude, mock_save, mock_load):
+        lunch = _make_event("Lunch")
+        sync = _make_event("Team Sync")
+        unclear_a = _make_event("Meditation")
+        unclear_b = _make_event("Quiet Time")
+        mock_claude.side_effect = lambda e: "SKIP" if e is unclear_b else "RECORD"
+
+        decisions = classify_events([lunch, sync, unclear_a, unclear_b])
+
+        assert decisions == {
+            lunch.id: False,
+            sync.id: True,
+            unclear_a.id: True,
+            unclear_b.id: False,
+        }
+        assert mock_claude.call_count == 2
+        mock_save.assert_called_once()
+        assert set(mock_save.call_args[0][0]) == set(decisions)
+
+    @patch("kumbuka.meeting_filter._load_cache", side_effect=Exception("disk error"))
+    def test_exception_defaults_all_to_true(self, mock_load):
+        events = [_make_event("Lunch"), _make_event("Team Sync")]
+        assert classify_events(events) == {e.id: True for e in events}
+
+
 class TestCache:
     """Test cache loading and saving."""
 
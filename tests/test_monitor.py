@@ -7,9 +7,14 @@ from unittest.mock import patch, MagicMock
 
 import pytest
 
+from kumbuka.daemon import monitor
 from kumbuka.daemon.monitor import (
+    _check_calendar_once,
+    check_calendar,
     load_prompted,
+    run_forever,
     save_prompted,
+    show_record_dialog,
     start_auto_recording,
 )
 from kumbuka.calendar_scraper import CalendarEvent, _generate_event_id
@@ -42,14 +47,21 @@ class TestPromptedPersistence:
         prompted_file = tmp_path / "prompted.json"
         monkeypatch.setattr("kumbuka.daemon.monitor.PROMPTED_FILE", prompted_file)
 
-        save_prompted({"event1", "event2"})
+        save_prompted({"event1": time.time(), "event2": time.time()})
         loaded = load_prompted()
         assert "event1" in loaded
         assert "event2" in loaded
 
+    def test_save_leaves_no_temp_file(self, tmp_path, monkeypatch):
+        prompted_file = tmp_path / "prompted.json"
+        monkeypatch.setattr("kumbuka.daemon.monitor.PROMPTED_FILE", prompted_file)
+
+        save_prompted({"event1": time.time()})
+        assert [p.name for p in tmp_path.iterdir()] == ["prompted.json"]
+
     def test_load_missing_file(self, tmp_path, monkeypatch):
         monkeypatch.setattr("kumbuka.daemon.monitor.PROMPTED_FILE", tmp_path / "nope.json")
-        assert load_prompted() == set()
+        assert load_prompted() == {}
 
     def test_expired_entries_purged(self, tmp_path, monkeypatch):
         prompted_file = tmp_path / "prompted.json"
@@ -62,6 +74,69 @@ class TestPromptedPersistence:
         assert "old_event" not in loaded
 
 
+class TestGetPrompted:
+
+    @pytest.fixture(autouse=True)
+    def _isolate(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("kumbuka.daemon.monitor.PROMPTED_FILE", tmp_path / "prompted.json")
+        monkeypatch.setattr("kumbuka.daemon.monitor._prompted", None)
+        monkeypatch.setattr("kumbuka.daemon.monitor._prompted_mtime_ns", None)
+
+    def test_reuses_map_until_file_changes(self):
+        save_prompted({"event1": time.time()})
+        first = monitor._get_prompted()
+
+        with patch("kumbuka.daemon.monitor.load_prompted") as mock_load:
+            assert monitor._get_prompted() is first
+            mock_load.assert_not_called()
+
+    def test_reloads_after_external_edit(self):
+        save_prompted({"event1": time.time()})
+        monitor._get_prompted()
+
+        monitor.PROMPTED_FILE.unlink()
+        assert monitor._get_prompted() == {}
+
+
+class TestShowRecordDialog:
+
+    @patch("kumbuka.daemon.monitor.subprocess.run")
+    @patch("kumbuka.daemon.monitor._show_native_dialog", return_value=True)
+    def test_prefers_native_dialog(self, mock_native, mock_run, monkeypatch):
+        monkeypatch.setattr("kumbuka.daemon.monitor.NSAlert", object())
+
+        assert show_record_dialog("Team Sync") is True
+        mock_native.assert_called_once_with("Team Sync")
+        mock_run.assert_not_called()
+
+    @patch("kumbuka.daemon.monitor.log")
+    @patch("kumbuka.daemon.monitor.subprocess.run")
+    @patch("kumbuka.daemon.monitor._show_native_dialog", side_effect=RuntimeError("no GUI"))
+    def test_falls_back_to_osascript(self, _native, mock_run, _log, monkeypatch):
+        monkeypatch.setattr("kumbuka.daemon.monitor.NSAlert", object())
+        mock_run.return_value = MagicMock(stdout="yes\n")
+
+        assert show_record_dialog("Team Sync") is True
+        assert mock_run.call_args[0][0][0] == "osascript"
+
+    @patch("kumbuka.daemon.monitor.subprocess.run")
+    def test_osascript_title_is_escaped(self, mock_run, monkeypatch):
+        monkeypatch.setattr("kumbuka.daemon.monitor.NSAlert", None)
+        mock_run.return_value = MagicMock(stdout="no\n")
+
+        show_record_dialog('Team\'s "Q3" C:\\plan')
+
+        script = mock_run.call_args[0][0][2]
+        assert 'Meeting: Team\u2019s \\"Q3\\" C:\\\\plan"' in script
+
+    @patch("kumbuka.daemon.monitor.subprocess.run")
+    def test_osascript_without_pyobjc(self, mock_run, monkeypatch):
+        monkeypatch.setattr("kumbuka.daemon.monitor.NSAlert", None)
+        mock_run.return_value = MagicMock(stdout="no\n")
+
+        assert show_record_dialog("Team Sync") is False
+
+
 class TestStartAutoRecording:
 
     @patch("kumbuka.daemon.monitor.subprocess.Popen")
@@ -98,3 +173,154 @@ class TestStartAutoRecording:
         duration_idx = call_args.index("--duration") + 1
         duration = int(call_args[duration_idx])
         assert duration >= 300  # minimum 5 min
+
+    @patch("kumbuka.daemon.monitor.subprocess.Popen")
+    @patch("kumbuka.daemon.monitor.find_python", return_value="/usr/bin/python3")
+    @patch("kumbuka.recording_lock.get_active_recording", return_value=None)
+    def test_title_passed_as_single_argument(self, mock_lock, mock_python, mock_popen, tmp_path, monkeypatch):
+        from kumbuka.__main__ import _build_parser
+
+        monkeypatch.setattr("kumbuka.daemon.monitor.OUTPUT_DIR", tmp_path)
+
+        start_auto_recording(_make_event("-standup", minutes_from_now=30))
+
+        call_args = mock_popen.call_args[0][0]
+        assert "--meeting=-standup" in call_args
+        parsed = _build_parser().parse_args(call_args[3:])
+        assert parsed.meeting == "-standup"
+
+
+class TestCheckCalendar:
+
+    @patch("kumbuka.daemon.monitor.log")
+    @patch("kumbuka.daemon.monitor._check_calendar_once")
+    @patch("kumbuka.recording_lock.get_active_recording")
+    def test_skips_scrape_while_recording(self, mock_active, mock_once, _log, monkeypatch):
+        monkeypatch.setattr("kumbuka.daemon.monitor.AUTO_RECORD", True)
+        mock_active.return_value = MagicMock(mode="auto", pid=123)
+
+        assert check_calendar() == 1
+        mock_once.assert_not_called()
+
+    @patch("kumbuka.daemon.monitor._check_calendar_once", return_value=3)
+    @patch("kumbuka.recording_lock.get_active_recording", return_value=None)
+    def test_checks_when_idle(self, _active, mock_once, monkeypatch):
+        monkeypatch.setattr("kumbuka.daemon.monitor.AUTO_RECORD", True)
+
+        assert check_calendar() == 3
+        mock_once.assert_called_once()
+
+
+class TestRunForever:
+
+    @patch("kumbuka.daemon.monitor.log")
+    @patch("kumbuka.daemon.monitor.time.sleep")
+    @patch("kumbuka.daemon.monitor.check_calendar")
+    def test_keeps_polling_after_errors(self, mock_check, mock_sleep, mock_log):
+        mock_check.side_effect = [RuntimeError("boom"), 0]
+        # Stop the loop on the second sleep
+        mock_sleep.side_effect = [None, KeyboardInterrupt]
+
+        with pytest.raises(KeyboardInterrupt):
+            run_forever(min_interval=40, max_interval=400)
+
+        assert mock_check.call_count == 2
+        mock_log.assert_called_once_with("Unhandled error in monitor: boom")
+
+    @patch("kumbuka.daemon.monitor.random.uniform", return_value=1.0)
+    @patch("kumbuka.daemon.monitor.time.sleep")
+    @patch("kumbuka.daemon.monitor.check_calendar")
+    def test_backs_off_while_idle(self, mock_check, mock_sleep, _uniform):
+        mock_check.side_effect = [0, 0, 0, 0, 2, 0]
+        mock_sleep.side_effect = [None] * 5 + [KeyboardInterrupt]
+
+        with pytest.raises(KeyboardInterrupt):
+            run_forever(min_interval=60, max_interval=300)
+
+        sleeps = [c.args[0] for c in mock_sleep.call_args_list]
+        assert sleeps == [120, 240, 300, 300, 60, 120]
+
+    @patch("kumbuka.daemon.monitor.random.uniform", return_value=1.0)
+    @patch("kumbuka.daemon.monitor.time.sleep")
+    @patch("kumbuka.daemon.monitor.check_calendar", return_value=0)
+    def test_wakes_for_next_event(self, _check, mock_sleep, _uniform, monkeypatch):
+        monkeypatch.setattr("kumbuka.daemon.monitor.PROMPT_MINUTES", 2)
+        next_start = datetime.now(timezone.utc) + timedelta(minutes=2, seconds=90)
+        monkeypatch.setattr("kumbuka.daemon.monitor._next_event_start", next_start)
+        mock_sleep.side_effect = [KeyboardInterrupt]
+
+        with pytest.raises(KeyboardInterrupt):
+            run_forever(min_interval=60, max_interval=300)
+
+        assert 85 <= mock_sleep.call_args.args[0] <= 90
+
+    @patch("kumbuka.daemon.monitor.time.sleep")
+    @patch("kumbuka.daemon.monitor.check_calendar", return_value=1)
+    def test_sleep_is_jittered(self, _check, mock_sleep):
+        mock_sleep.side_effect = [None, None, KeyboardInterrupt]
+
+        with pytest.raises(KeyboardInterrupt):
+            run_forever(min_interval=100, max_interval=100)
+
+        for call in mock_sleep.call_args_list:
+            assert 90 <= call.args[0] <= 110
+
+
+class TestCheckCalendarOnce:
+
+    @pytest.fixture(autouse=True)
+    def _isolate(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("kumbuka.daemon.monitor.PROMPTED_FILE", tmp_path / "prompted.json")
+        monkeypatch.setattr("kumbuka.daemon.monitor._prompted", None)
+        monkeypatch.setattr("kumbuka.daemon.monitor._prompted_mtime_ns", None)
+        monkeypatch.setattr("kumbuka.daemon.monitor.AUTO_RECORD", True)
+        monkeypatch.setattr("kumbuka.daemon.monitor.log", lambda _msg: None)
+        monkeypatch.setattr("kumbuka.calendar_scraper.get_next_event_start", lambda _m: None)
+
+    @patch("kumbuka.daemon.monitor.start_auto_recording")
+    @patch("kumbuka.daemon.monitor.save_prompted")
+    @patch("kumbuka.meeting_filter.classify_events")
+    @patch("kumbuka.calendar_scraper.get_meetings")
+    def test_saves_only_when_new_event_seen(
+        self, mock_meetings, mock_classify, mock_save, mock_start,
+    ):
+        event = _make_event("Team Sync")
+        mock_meetings.return_value = ([], [event])
+        mock_classify.return_value = {event.id: True}
+
+        _check_calendar_once()
+        _check_calendar_once()
+
+        mock_classify.assert_called_once_with([event])
+        mock_start.assert_called_once_with(event)
+        mock_save.assert_called_once()
+        assert event.id in monitor._prompted
+
+    @patch("kumbuka.daemon.monitor.start_auto_recording")
+    @patch("kumbuka.daemon.monitor.save_prompted")
+    @patch("kumbuka.meeting_filter.classify_events")
+    @patch("kumbuka.calendar_scraper.get_meetings")
+    def test_skipped_event_is_not_recorded(
+        self, mock_meetings, mock_classify, mock_save, mock_start,
+    ):
+        event = _make_event("Lunch")
+        mock_meetings.return_value = ([], [event])
+        mock_classify.return_value = {event.id: False}
+
+        _check_calendar_once()
+
+        mock_start.assert_not_called()
+        assert event.id in monitor._prompted
+
+    @patch("kumbuka.daemon.monitor.save_prompted")
+    @patch("kumbuka.meeting_filter.classify_events", side_effect=RuntimeError("claude down"))
+    @patch("kumbuka.calendar_scraper.get_meetings")
+    def test_failed_classification_is_retried(self, mock_meetings, _should, mock_save):
+        event = _make_event("Team Sync")
+        mock_meetings.return_value = ([], [event])
+
+        with pytest.raises(RuntimeError):
+            _check_calendar_once()
+
+        assert event.id not in monitor._prompted
+        mock_save.assert_not_called()
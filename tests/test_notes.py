@@ -75,3 +75,31 @@ def test_config_invalid_destination_warns_and_falls_back(monkeypatch):
 
     assert config.NOTES_DESTINATION == "terminal"
     assert any("Falling back to terminal output only" in str(w.message) for w in caught)
+
+
+def test_print_notes_matches_format_notes():
+    import io
+
+    from kumbuka.render import format_notes, print_notes
+
+    result = {
+        "title": "Weekly Sync",
+        "participants": ["Alex", "Sam"],
+        "summary": "Shipped it.",
+        "feedback": "",
+        "transcript": "Alex: hi",
+    }
+    out = io.StringIO()
+    print_notes(result, out)
+
+    assert out.getvalue() == format_notes(result) + "\n"
+
+
+def test_preload_backend_imports_notion_module(monkeypatch):
+    import kumbuka
+    from kumbuka.notes import preload_backend
+
+    monkeypatch.delitem(sys.modules, "kumbuka.notion", raising=False)
+    monkeypatch.delattr(kumbuka, "notion", raising=False)
+    preload_backend("notion", notion_mode="token")
+    assert "kumbuka.notion" in sys.modules
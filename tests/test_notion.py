@@ -0,0 +1,89 @@
+"""Tests for the Notion API wrapper."""
+
+import json
+
+from kumbuka import notion
+from kumbuka.notion import _text_to_blocks
+
+
+def _types(blocks):
+    return [b["type"] for b in blocks]
+
+
+def _text(block):
+    return block[block["type"]]["rich_text"][0]["text"]["content"]
+
+
+def test_headings_bullets_and_divider():
+    blocks = _text_to_blocks("# One\n## Two\n### Three\n- a\n* b\n---")
+
+    assert _types(blocks) == [
+        "heading_1", "heading_2", "heading_3",
+        "bulleted_list_item", "bulleted_list_item", "divider",
+    ]
+    assert [_text(b) for b in blocks[:5]] == ["One", "Two", "Three", "a", "b"]
+
+
+def test_checkboxes_are_not_bullets():
+    blocks = _text_to_blocks("- [ ] open item\n- [x] done item\n- [X] also done")
+
+    assert _types(blocks) == ["to_do", "to_do", "to_do"]
+    assert [b["to_do"]["checked"] for b in blocks] == [False, True, True]
+    assert _text(blocks[0]) == "open item"
+
+
+def test_paragraph_lines_are_joined():
+    blocks = _text_to_blocks("first line\nsecond line\n\n#hashtag not a heading")
+
+    assert _types(blocks) == ["paragraph", "paragraph"]
+    assert _text(blocks[0]) == "first line second line"
+    assert _text(blocks[1]) == "#hashtag not a heading"
+
+
+def test_client_is_reused(monkeypatch):
+    monkeypatch.setattr(notion, "_client_instance", None)
+
+    first = notion._client()
+    try:
+        assert notion._client() is first
+    finally:
+        first.close()
+
+
+def test_append_blocks_sends_ordered_chunks(monkeypatch):
+    import httpx
+
+    sizes = []
+
+    def handler(request):
+        sizes.append(len(json.loads(request.content)["children"]))
+        return httpx.Response(200, json={"object": "list"})
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(notion, "_client_instance", client)
+
+    content = "\n".join(f"- item {i}" for i in range(250))
+    notion.append_blocks("a" * 32, content, token="secret")
+
+    assert sizes == [100, 100, 50]
+
+
+def test_extract_page_id_formats():
+    raw = "0123456789abcdef0123456789abcdef"
+    dashed = "01234567-89ab-cdef-0123-456789abcdef"
+
+    assert notion.extract_page_id(raw) == dashed
+    assert notion.extract_page_id(dashed) == dashed
+    assert notion.extract_page_id(f"https://www.notion.so/Meetings-{raw}") == dashed
+
+
+def test_append_blocks_skips_request_for_blank_content(monkeypatch):
+    import httpx
+
+    def handler(request):
+        raise AssertionError(f"unexpected request: {request.method} {request.url}")
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(notion, "_client_instance", client)
+
+    assert notion.append_blocks("a" * 32, " \n\n\t", token="secret") == {}
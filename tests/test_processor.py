@@ -0,0 +1,33 @@
+"""Tests for Claude stream-json processing."""
+
+import json
+import sys
+
+from kumbuka.processor import _run_claude_structured
+
+
+def _fake_claude(tmp_path, events):
+    """Write an executable that prints the given events as stream-json lines."""
+    script = tmp_path / "claude"
+    lines = "\n".join(json.dumps(e) for e in events)
+    script.write_text(f"#!{sys.executable}\nimport sys\nsys.stdout.write({lines!r} + '\\n')\n")
+    script.chmod(0o755)
+    return str(script)
+
+
+def test_streams_text_and_returns_structured_output(tmp_path, capsys):
+    claude = _fake_claude(tmp_path, [
+        {"type": "system", "subtype": "init", "tools": ["Read"]},
+        {"type": "assistant", "message": {"content": [
+            {"type": "text", "text": "Working"},
+            {"type": "tool_use", "name": "Read"},
+            {"type": "text", "text": "..."},
+        ]}},
+        {"type": "user", "message": {"content": [{"type": "tool_result", "content": "x"}]}},
+        {"type": "result", "structured_output": {"title": "Weekly Sync"}},
+    ])
+
+    result = _run_claude_structured(claude, "prompt")
+
+    assert result == {"title": "Weekly Sync"}
+    assert capsys.readouterr().out == "Working..."
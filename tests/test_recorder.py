@@ -38,3 +38,153 @@ class TestRecordDuration:
         duration_secs = 300
         effective_max = min(duration_secs, MAX_DURATION) if duration_secs else MAX_DURATION
         assert effective_max == 300
+
+
+class TestRecoverPartial:
+    """Test recovering interrupted recordings."""
+
+    def _write_wav(self, path, frames: int):
+        import wave
+        from kumbuka.recorder import SAMPLE_RATE, CHANNELS
+
+        with wave.open(str(path), "wb") as w:
+            w.setnchannels(CHANNELS)
+            w.setsampwidth(2)
+            w.setframerate(SAMPLE_RATE)
+            w.writeframes(b"\x00\x00" * CHANNELS * frames)
+
+    def test_returns_duration_from_header(self, tmp_path, monkeypatch):
+        from kumbuka import recorder
+
+        monkeypatch.setattr(recorder, "OUTPUT_DIR", tmp_path)
+        self._write_wav(tmp_path / "2025-01-01_10-00-00.partial.wav", recorder.SAMPLE_RATE * 90)
+
+        wav_path, duration = recorder.recover_partial()
+
+        assert wav_path == tmp_path / "2025-01-01_10-00-00.wav"
+        assert wav_path.exists()
+        assert duration == pytest.approx(90.0)
+
+    def test_picks_most_recent_partial(self, tmp_path, monkeypatch):
+        import os
+        from kumbuka import recorder
+
+        monkeypatch.setattr(recorder, "OUTPUT_DIR", tmp_path)
+        older = tmp_path / "2025-01-01_09-00-00.partial.wav"
+        newer = tmp_path / "2025-01-01_10-00-00.partial.wav"
+        self._write_wav(older, 10)
+        self._write_wav(newer, 10)
+        os.utime(older, (1_000, 1_000))
+        (tmp_path / "notes.txt").write_text("not audio")
+
+        wav_path, _ = recorder.recover_partial()
+
+        assert wav_path == tmp_path / "2025-01-01_10-00-00.wav"
+        assert older.exists()
+
+    def test_missing_session(self, tmp_path, monkeypatch):
+        from kumbuka import recorder
+
+        monkeypatch.setattr(recorder, "OUTPUT_DIR", tmp_path)
+        assert recorder.recover_partial("nope") == (None, 0.0)
+
+
+class TestAppendIncremental:
+    """Test single-stream incremental saves."""
+
+    def test_appends_only_new_audio(self, tmp_path, monkeypatch):
+        import wave
+        import numpy as np
+        from kumbuka import recorder
+
+        monkeypatch.setattr(recorder, "OUTPUT_DIR", tmp_path)
+        monkeypatch.setattr(recorder, "np", np)
+        monkeypatch.setattr(recorder, "_partial", None)
+        monkeypatch.setattr(recorder, "_partial_frames", 0)
+        second = recorder.SAMPLE_RATE
+
+        monkeypatch.setattr(recorder, "_primary", recorder._AudioBuffer())
+        recorder._primary.append(np.ones((second, 1), dtype=np.int16))
+        assert recorder._append_incremental("s") == pytest.approx(1.0)
+        assert len(recorder._primary) == 0
+
+        # The partial file is a complete WAV between saves
+        with wave.open(str(tmp_path / "s.partial.wav"), "rb") as w:
+            assert w.getnframes() == second
+
+        recorder._primary.append(np.full((second * 2, 1), 2, dtype=np.int16))
+        assert recorder._append_incremental("s", final=True) == pytest.approx(3.0)
+
+        with wave.open(str(tmp_path / "s.wav"), "rb") as w:
+            frames = np.frombuffer(w.readframes(w.getnframes()), dtype=np.int16)
+        assert len(frames) == second * 3
+        assert frames[0] == 1 and frames[-1] == 2
+        assert not (tmp_path / "s.partial.wav").exists()
+
+
+class TestAudioBuffer:
+    """Test the segmented capture buffer."""
+
+    def test_grows_and_preserves_order(self, monkeypatch):
+        import numpy as np
+        from kumbuka import recorder
+
+        monkeypatch.setattr(recorder, "np", np)
+        buf = recorder._AudioBuffer(segment_frames=4)
+        for value in range(5):
+            buf.append(np.full((3, 1), value, dtype=np.int16))
+
+        audio = buf.snapshot()
+        assert len(buf) == 15
+        assert audio[:, 0].tolist() == [v for v in range(5) for _ in range(3)]
+
+    def test_growth_keeps_existing_segments(self, monkeypatch):
+        import numpy as np
+        from kumbuka import recorder
+
+        monkeypatch.setattr(recorder, "np", np)
+        buf = recorder._AudioBuffer(segment_frames=8)
+        buf.append(np.ones((6, 1), dtype=np.int16))
+        first = buf._segments[0]
+        for _ in range(5):
+            buf.append(np.full((6, 1), 2, dtype=np.int16))
+
+        # Growing adds segments instead of copying captured audio
+        assert buf._segments[0] is first
+        assert len(buf._segments) == 5
+        audio = buf.snapshot()
+        assert len(audio) == len(buf) == 36
+        assert audio[:6, 0].tolist() == [1] * 6 and audio[6:, 0].tolist() == [2] * 30
+
+    def test_drain_empties_buffer(self, monkeypatch):
+        import numpy as np
+        from kumbuka import recorder
+
+        monkeypatch.setattr(recorder, "np", np)
+        buf = recorder._AudioBuffer(segment_frames=4)
+        buf.append(np.ones((2, 1), dtype=np.int16))
+
+        assert len(buf.drain()) == 2
+        assert len(buf) == 0
+        assert len(buf.drain()) == 0
+
+
+class TestTones:
+
+    def test_start_tone_built_once(self, monkeypatch):
+        import numpy as np
+        from kumbuka import recorder
+
+        monkeypatch.setattr(recorder, "np", np)
+        mock_sd = MagicMock()
+        monkeypatch.setattr(recorder, "sd", mock_sd)
+        recorder._tone_samples.cache_clear()
+
+        recorder.play_start_tone()
+        recorder.play_start_tone()
+
+        first, second = (c.args[0] for c in mock_sd.play.call_args_list)
+        assert first is second
+        assert len(first) == int(recorder.SAMPLE_RATE * 0.1) + int(recorder.SAMPLE_RATE * 0.15)
+        assert recorder._tone_samples.cache_info().misses == 1
+        recorder._tone_samples.cache_clear()
@@ -0,0 +1,35 @@
+"""Tests for FluidAudio transcription."""
+
+import sys
+
+from kumbuka import transcriber
+
+
+def _fake_fluidaudio(tmp_path, output: str, exit_code: int = 0):
+    script = tmp_path / "fluidaudio"
+    script.write_text(
+        f"#!{sys.executable}\nimport sys\nsys.stdout.write({output!r})\nsys.exit({exit_code})\n"
+    )
+    script.chmod(0o755)
+    return script
+
+
+def test_transcript_saved_next_to_audio(tmp_path, monkeypatch):
+    monkeypatch.setattr(transcriber, "FLUIDAUDIO_BIN", _fake_fluidaudio(tmp_path, "  hello there\n"))
+    monkeypatch.setattr(transcriber, "_ensure_fluidaudio", lambda: True)
+    wav = tmp_path / "session.wav"
+
+    assert transcriber.transcribe(wav) == "hello there"
+    assert (tmp_path / "session.txt").read_text() == "hello there"
+    assert not (tmp_path / "session.txt.tmp").exists()
+
+
+def test_failure_keeps_previous_transcript(tmp_path, monkeypatch):
+    monkeypatch.setattr(transcriber, "FLUIDAUDIO_BIN", _fake_fluidaudio(tmp_path, "", exit_code=1))
+    monkeypatch.setattr(transcriber, "_ensure_fluidaudio", lambda: True)
+    wav = tmp_path / "session.wav"
+    (tmp_path / "session.txt").write_text("earlier transcript")
+
+    assert transcriber.transcribe(wav) is None
+    assert (tmp_path / "session.txt").read_text() == "earlier transcript"
+    assert not (tmp_path / "session.txt.tmp").exists()